@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for ML Training Tracker
+Measures the overhead of the tracker's hot paths.
+
+Results are written as JSON so runs from different versions can be
+compared with ``--compare previous.json``.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+import threading
+from datetime import datetime
+
+import numpy as np
+
+# Add the scripts directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from ml_training_tracker import TrainingMetrics, MetricsStorage, TrainingTracker, TrainingConfig
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+DEFAULT_THREADS = (1, 2, 4, 8, 16)
+DEFAULT_EXTRA_METRICS = (0, 8)
+# Metrics are drawn cyclically from a pool so 1e7-step runs do not need 1e7 objects
+METRIC_POOL_SIZE = 4096
+
+def _metric_pool(size: int, extra_metrics: int = 0):
+    """TrainingMetrics with ``extra_metrics`` additional metrics each"""
+    return [
+        TrainingMetrics(
+            epoch=i // 1000, step=i, loss=1.0 / (i + 1), accuracy=0.5, learning_rate=1e-3,
+            additional_metrics={f'metric_{k}': float(k) for k in range(extra_metrics)}
+        )
+        for i in range(size)
+    ]
+
+def _run_producers(storage: MetricsStorage, num_threads: int, metrics_per_thread: int, add=None):
+    """Add metrics from num_threads producer threads
+
+    ``add`` defaults to ``storage.add_metric``. Returns the seconds spent by
+    the producers and by the first reader query, which pays for the merge in
+    sharded mode.
+    """
+    add = add or storage.add_metric
+    # Build the metrics up front so only the add is timed
+    pool = _metric_pool(min(metrics_per_thread, METRIC_POOL_SIZE))
+    barrier = threading.Barrier(num_threads + 1)
+
+    def produce():
+        barrier.wait()
+        for i in range(metrics_per_thread):
+            add(pool[i % len(pool)])
+
+    threads = [threading.Thread(target=produce) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    produced = time.perf_counter()
+    len(storage)
+    return produced - start, time.perf_counter() - produced
+
+def benchmark_ingestion_scaling(thread_counts=(1, 2, 4, 8, 16), metrics_per_thread: int = 20000):
+    """Compare locked and sharded ingestion throughput across producer threads"""
+    print("Producer-side ingestion throughput (metrics/sec)")
+    print(f"{'threads':>8} {'locked':>14} {'sharded':>14} {'speedup':>9} {'merge (s)':>10}")
+
+    results = []
+    for num_threads in thread_counts:
+        total = num_threads * metrics_per_thread
+        locked, _ = _run_producers(MetricsStorage(max_history=total), num_threads, metrics_per_thread)
+        sharded, merge = _run_producers(
+            MetricsStorage(max_history=total, sharded=True), num_threads, metrics_per_thread
+        )
+
+        result = {
+            'threads': num_threads,
+            'locked_throughput': total / locked,
+            'sharded_throughput': total / sharded,
+            'sharded_merge_seconds': merge,
+        }
+        results.append(result)
+        print(f"{num_threads:>8} {result['locked_throughput']:>14,.0f} "
+              f"{result['sharded_throughput']:>14,.0f} {locked / sharded:>8.2f}x {merge:>10.3f}")
+
+    return results
+
+def benchmark_import_time(budget_seconds: float = 1.0, runs: int = 5):
+    """Measure the import time of the core logging path in fresh interpreters
+    
+    Asserts that the best of ``runs`` imports stays within ``budget_seconds``
+    and that none of the heavy optional dependencies are imported.
+    """
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import ml_training_tracker\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = ('pandas', 'matplotlib', 'seaborn', 'torch', 'tensorflow')\n"
+        "print(elapsed, ','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', script], capture_output=True, text=True, cwd=cwd, check=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ''
+        assert not loaded, f"Heavy dependencies imported eagerly: {loaded}"
+    
+    best = min(timings)
+    print(f"Import time of ml_training_tracker: best {best * 1000:.1f} ms, "
+          f"median {sorted(timings)[len(timings) // 2] * 1000:.1f} ms (budget {budget_seconds * 1000:.0f} ms)")
+    assert best <= budget_seconds, f"Import took {best:.3f}s, over the {budget_seconds:.3f}s budget"
+    return {'best_seconds': best, 'timings': timings, 'budget_seconds': budget_seconds}
+
+def _tracker(log_dir: str, steps: int, **overrides) -> TrainingTracker:
+    """A tracker that keeps every step and stays quiet on the console"""
+    config = TrainingConfig(
+        experiment_name="benchmark",
+        log_dir=log_dir,
+        checkpoint_dir=os.path.join(log_dir, "checkpoints"),
+        metric_history_size=steps,
+        log_policy="every_n_steps",
+        log_every_n_steps=max(steps, 1),
+        report_format="npz",
+        enable_tensorboard=False,
+        enable_wandb=False,
+        **overrides
+    )
+    return TrainingTracker(config)
+
+def _timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+def _record(results, benchmark: str, steps: int, extra_metrics: int, threads: int, seconds: float, ops: int):
+    result = {
+        'benchmark': benchmark,
+        'steps': steps,
+        'extra_metrics': extra_metrics,
+        'threads': threads,
+        'seconds': seconds,
+        'per_op_us': seconds / ops * 1e6,
+        'ops_per_sec': ops / seconds if seconds > 0 else None,
+    }
+    results.append(result)
+    print(f"{benchmark:>22} {steps:>10,} {extra_metrics:>6} {threads:>8} {seconds:>10.3f} {result['per_op_us']:>12.2f}")
+    return result
+
+def benchmark_hot_paths(sizes=DEFAULT_SIZES, extra_metric_counts=DEFAULT_EXTRA_METRICS,
+                        thread_counts=DEFAULT_THREADS):
+    """Time the tracker's per-step and per-report paths at each run length
+    
+    Per-step paths (``log_metrics``, ``MetricsStorage.add_metric``, an empty
+    ``phase`` block) report microseconds per step; the query and report paths (``get_metrics_df``
+    cold and cached, ``get_training_summary``, ``save_training_report``
+    and ``_generate_plots``) are timed once against a full history.
+    """
+    # Import the lazily loaded libraries up front so the first timings do not include them
+    import pandas  # noqa: F401
+    import matplotlib.figure  # noqa: F401
+    
+    print(f"{'benchmark':>22} {'steps':>10} {'extra':>6} {'threads':>8} {'seconds':>10} {'us/op':>12}")
+    results = []
+    for steps in sizes:
+        steps = int(steps)
+        for extra in extra_metric_counts:
+            pool = _metric_pool(min(steps, METRIC_POOL_SIZE), extra)
+            
+            storage = MetricsStorage(max_history=steps)
+            seconds = _timed(lambda: [storage.add_metric(pool[i % len(pool)]) for i in range(steps)])
+            _record(results, 'add_metric', steps, extra, 1, seconds, steps)
+            del storage
+            
+            with tempfile.TemporaryDirectory() as log_dir:
+                tracker = _tracker(log_dir, steps)
+                log = tracker.log_metrics
+                seconds = _timed(lambda: [log(pool[i % len(pool)]) for i in range(steps)])
+                _record(results, 'log_metrics', steps, extra, 1, seconds, steps)
+                
+                timer = tracker.phase('benchmark')
+                
+                def time_phases():
+                    for _ in range(steps):
+                        with timer:
+                            pass
+                _record(results, 'phase', steps, extra, 1, _timed(time_phases), steps)
+                
+                storage = tracker.metrics_storage
+                _record(results, 'get_metrics_df', steps, extra, 1, _timed(storage.get_metrics_df), 1)
+                _record(results, 'get_metrics_df_cached', steps, extra, 1, _timed(storage.get_metrics_df), 1)
+                _record(results, 'get_training_summary', steps, extra, 1, _timed(tracker.get_training_summary), 1)
+                plots_dir = tracker.log_dir / 'plots'
+                plots_dir.mkdir(exist_ok=True)
+                _record(results, '_generate_plots', steps, extra, 1, _timed(tracker._generate_plots, plots_dir), 1)
+                _record(results, 'save_training_report', steps, extra, 1,
+                        _timed(tracker.save_training_report), 1)
+                tracker.end_training()
+            
+            for num_threads in thread_counts:
+                if num_threads == 1:
+                    continue
+                with tempfile.TemporaryDirectory() as log_dir:
+                    tracker = _tracker(log_dir, steps)
+                    seconds, _ = _run_producers(
+                        tracker.metrics_storage, num_threads, steps // num_threads, add=tracker.log_metrics
+                    )
+                    _record(results, 'log_metrics', steps, extra, num_threads, seconds,
+                            steps // num_threads * num_threads)
+                    tracker.end_training()
+    return results
+
+def benchmark_self_overhead(steps: int = 20000, step_seconds: float = 0.0005, extra_metrics: int = 8):
+    """Run a simulated training loop with ``self_profile`` and report the tracker's share of wall time
+    
+    Each step busy-waits ``step_seconds`` to stand in for the training work.
+    """
+    pool = _metric_pool(min(steps, METRIC_POOL_SIZE), extra_metrics)
+    with tempfile.TemporaryDirectory() as log_dir:
+        tracker = _tracker(log_dir, steps, self_profile=True)
+        tracker.start_training()
+        for i in range(steps):
+            deadline = time.perf_counter() + step_seconds
+            while time.perf_counter() < deadline:
+                pass
+            tracker.log_metrics(pool[i % len(pool)])
+            if (i + 1) % 1000 == 0:
+                tracker.on_epoch_end(i // 1000, pool[i % len(pool)])
+        report = tracker.get_training_summary()['self_profile']
+        tracker.end_training()
+    
+    print(f"Tracker self-overhead over {steps:,} steps of {step_seconds * 1e3:.2f} ms: "
+          f"{report['tracker_seconds']:.3f}s of {report['wall_seconds']:.2f}s ({report['percent_of_wall']:.2f}%)")
+    for name, stats in sorted(report['methods'].items(), key=lambda item: -item[1]['total_seconds']):
+        print(f"  {name:>22}: {stats['count']:>8,} calls, mean {stats['mean_us']:.2f} us, p95 {stats['p95_us']:.2f} us")
+    return report
+
+def write_results(results, path: str):
+    """Write benchmark results with the environment they were measured in"""
+    document = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': _git_commit(),
+        **results,
+    }
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2, default=str)
+    print(f"Results written to {path}")
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(previous_path: str, results):
+    """Print the per-op time of matching hot-path results relative to a previous run"""
+    with open(previous_path) as f:
+        previous = json.load(f)
+    key = lambda result: (result['benchmark'], result['steps'], result['extra_metrics'], result['threads'])
+    baseline = {key(result): result for result in previous.get('hot_paths', [])}
+    print(f"Compared with {previous_path} ({previous.get('git_commit') or previous.get('timestamp')})")
+    for result in results:
+        old = baseline.get(key(result))
+        if old and old['per_op_us']:
+            ratio = result['per_op_us'] / old['per_op_us']
+            flag = "  <-- slower" if ratio > 1.1 else ""
+            print(f"{result['benchmark']:>22} {result['steps']:>10,} {result['extra_metrics']:>6} "
+                  f"{result['threads']:>8} {ratio:>8.2f}x{flag}")
+
+def main():
+    """Run all benchmarks"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=float, nargs='+', default=DEFAULT_SIZES, help="run lengths in steps")
+    parser.add_argument('--extra-metrics', type=int, nargs='+', default=DEFAULT_EXTRA_METRICS)
+    parser.add_argument('--threads', type=int, nargs='+', default=DEFAULT_THREADS)
+    parser.add_argument('--quick', action='store_true', help="only 1e3 and 1e4 steps")
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', help="previous results JSON to compare against")
+    parser.add_argument('--self-profile', action='store_true', help="only run the self-overhead benchmark")
+    args = parser.parse_args()
+    
+    # Keep the console for the benchmark tables
+    logging.getLogger('ml_training_tracker').setLevel(logging.WARNING)
+    
+    print("ML Training Tracker Benchmarks")
+    print("=" * 50)
+    if args.self_profile:
+        benchmark_self_overhead()
+        return
+    
+    document = {'import_time': benchmark_import_time()}
+    print()
+    document['ingestion_scaling'] = benchmark_ingestion_scaling(tuple(args.threads))
+    print()
+    sizes = (10 ** 3, 10 ** 4) if args.quick else args.sizes
+    hot_paths = benchmark_hot_paths(sizes, args.extra_metrics, args.threads)
+    document['hot_paths'] = hot_paths
+    print()
+    document['self_overhead'] = benchmark_self_overhead()
+    print()
+    write_results(document, args.output)
+    if args.compare:
+        print()
+        compare_results(args.compare, hot_paths)
+
+if __name__ == "__main__":
+    main()
@@ -106,12 +106,16 @@ def pytorch_training_example():
         train_correct = 0
         train_total = 0
         
-        for batch_idx, (inputs, labels) in enumerate(train_loader):
+        # Time data loading, forward, backward and optimizer phases
+        for batch_idx, (inputs, labels) in enumerate(tracker.profile_iter(train_loader, "data")):
             optimizer.zero_grad()
-            outputs = model(inputs)
-            loss = criterion(outputs, labels)
-            loss.backward()
-            optimizer.step()
+            with tracker.phase("forward"):
+                outputs = model(inputs)
+                loss = criterion(outputs, labels)
+            with tracker.phase("backward"):
+                loss.backward()
+            with tracker.phase("optimizer"):
+                optimizer.step()
             
             train_loss += loss.item()
             _, predicted = torch.max(outputs.data, 1)
@@ -136,7 +140,7 @@ def pytorch_training_example():
         val_correct = 0
         val_total = 0
         
-        with torch.no_grad():
+        with torch.no_grad(), tracker.phase("validation"):
             for inputs, labels in val_loader:
                 outputs = model(inputs)
                 loss = criterion(outputs, labels)
@@ -191,6 +195,8 @@ def pytorch_training_example():
     print(f"Experiment: {summary['experiment_name']}")
     print(f"Total Epochs: {summary['total_epochs']}")
     print(f"Best Validation Loss: {summary['best_metrics'].get('best_loss', 'N/A'):.4f}")
+    for name, stats in summary.get('phases', {}).get('total', {}).items():
+        print(f"Phase {name}: {stats['total_seconds']:.2f}s total, p50 {stats['p50_us']:.0f} µs")
     print(f"Report saved to: {report_path}")
     
     return tracker
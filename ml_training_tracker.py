@@ -4,22 +4,39 @@ Machine Learning Training Progress Tracker
 
 A comprehensive tool for tracking and visualizing machine learning model training progress.
 Supports multiple ML frameworks, real-time monitoring, and detailed analytics.
+
+Only NumPy is imported with the module. pandas, matplotlib, seaborn and the
+ML frameworks are imported by the features that need them, so processes that
+only log metrics start quickly.
 """
 
 import os
+import sys
 import json
+import math
+import functools
+import pickle
 import time
+import queue
+import atexit
+import zipfile
+import hashlib
 import logging
+import logging.handlers
+import warnings
+import importlib.util
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Set, Union
 from pathlib import Path
 import threading
-from dataclasses import dataclass, asdict
+import subprocess
+import heapq
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Client, Listener
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field, fields, replace
 from collections import defaultdict, deque
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from abc import ABC, abstractmethod
 
 # Configure logging
@@ -29,20 +46,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-TORCH_AVAILABLE = False
-try:
-    import torch
-    import torch.nn
-    import torch.optim
-    TORCH_AVAILABLE = True
-except ImportError:
+# Frameworks are detected without importing them; adapters import on use
+TORCH_AVAILABLE = importlib.util.find_spec('torch') is not None
+if not TORCH_AVAILABLE:
     logger.warning("PyTorch not available. PyTorch-specific features disabled.")
 
-TENSORFLOW_AVAILABLE = False
-try:
-    import tensorflow as tf
-    TENSORFLOW_AVAILABLE = True
-except ImportError:
+TENSORFLOW_AVAILABLE = importlib.util.find_spec('tensorflow') is not None
+if not TENSORFLOW_AVAILABLE:
     logger.warning("TensorFlow not available. TensorFlow-specific features disabled.")
 
 @dataclass
@@ -74,84 +84,2548 @@ class TrainingConfig:
     checkpoint_dir: str = "./checkpoints"
     save_frequency: int = 100
     max_checkpoints: int = 5
+    incremental_checkpoints: bool = False  # write only changed chunks (see ChunkStore)
+    checkpoint_monitor: Optional[str] = None  # metric ranking checkpoints for keep_best_checkpoints
+    checkpoint_mode: str = 'min'
+    keep_best_checkpoints: int = 0  # best-k kept in addition to the latest max_checkpoints
     early_stopping_patience: int = 10
     metric_history_size: int = 1000
+    # Extra metrics whose best value is tracked, e.g. {'name': 'val_loss', 'mode': 'min', 'smoothing': 5}
+    monitored_metrics: List[Dict[str, Any]] = field(default_factory=list)
+    sharded_ingestion: bool = False
+    shared_memory: bool = False  # expose recent metrics to other processes
+    shared_extra_slots: int = 16
+    async_sinks: bool = False
+    sink_queue_size: int = 10000
+    sink_backpressure: str = "block"  # 'block', 'drop_oldest' or 'sample'
+    sink_batch_size: int = 256
+    sink_sample_every: int = 10
+    log_policy: str = "every_step"  # 'every_step', 'every_n_steps', 'every_t_seconds' or 'on_improvement'
+    log_every_n_steps: int = 100
+    log_every_seconds: float = 10.0
+    async_file_logging: bool = True
+    report_format: str = "json"  # 'json', 'parquet', 'arrow-ipc' or 'npz'
+    enable_journal: bool = False
+    journal_fsync_interval: float = 5.0
+    plot_max_points: int = 2000  # roughly the pixel width of a report subplot
+    plot_downsample: str = "minmax"  # 'minmax', 'lttb' or 'none'
+    plot_ema_alpha: Optional[float] = None  # adds an EMA overlay when set
+    plot_workers: int = 2  # render processes; 0 renders in the report thread
+    async_reports: bool = False  # save_training_report returns a Future
+    track_throughput: bool = False  # add step time, rates, latency quantiles and ETA to each step
+    batch_size: Optional[int] = None  # samples per step, for samples_per_sec
+    num_epochs: Optional[int] = None  # planned epochs, for eta_seconds
+    steps_per_epoch: Optional[int] = None  # estimated from epoch boundaries when unset
+    throughput_window: int = 1000  # steps covered by the rolling latency quantiles
+    phase_cuda_timing: bool = False  # time tracker.phase() blocks with CUDA events when a GPU is present
+    self_profile: bool = False  # measure time spent inside tracker methods (see TrackerOverhead)
+    sample_resources: bool = False  # background CPU/memory/fd/IO sampling into storage
+    resource_sample_interval: float = 1.0  # seconds between resource samples
+    resource_history_size: int = 10000  # resource samples retained
     enable_tensorboard: bool = True
     enable_wandb: bool = False
     wandb_project: str = ""
     wandb_entity: str = ""
 
+class RunningStats:
+    """Streaming count/mean/variance/min/max/last of a metric (Welford)"""
+    
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max', 'last')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.last = float('nan')
+    
+    def add(self, value: float):
+        """Add a single value, ignoring NaN like ``add_batch``"""
+        if value != value:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.last = value
+    
+    def add_batch(self, values: np.ndarray):
+        """Add an array of values, ignoring NaN (Chan et al. parallel merge)"""
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += batch_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.last = float(values[-1])
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std': self.variance ** 0.5,
+            'min': self.min,
+            'max': self.max,
+            'last': self.last
+        }
+
+THROUGHPUT_METRICS = (
+    'step_time', 'steps_per_sec', 'samples_per_sec',
+    'step_time_p50', 'step_time_p95', 'step_time_p99', 'eta_seconds'
+)
+
+class QuantileSketch:
+    """Streaming quantiles with bounded relative error (log buckets, DDSketch style)
+    
+    Values in ``[min_value, max_value]`` are counted in logarithmic buckets
+    whose width is set by ``relative_accuracy``, so any quantile is within
+    that relative error of the exact one. Memory is fixed, adding a value is
+    O(1) and sketches merge by adding counts.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-6, max_value: float = 1e4):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._offset = math.floor(math.log(min_value) / self._log_gamma)
+        size = math.ceil(math.log(max_value) / self._log_gamma) - self._offset + 1
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.count = 0
+    
+    def add(self, value: float, weight: int = 1):
+        """Count ``value`` ``weight`` times; out-of-range values land in the edge buckets"""
+        if not value > 0:
+            index = 0
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma) - self._offset
+            index = min(max(index, 0), len(self.counts) - 1)
+        self.counts[index] += weight
+        self.count += weight
+    
+    def merge(self, other: 'QuantileSketch'):
+        self.counts += other.counts
+        self.count += other.count
+    
+    def clear(self):
+        self.counts[:] = 0
+        self.count = 0
+    
+    def quantiles(self, qs, others: tuple = ()) -> List[float]:
+        """Quantiles ``qs`` of this sketch combined with ``others``"""
+        counts = self.counts
+        total = self.count
+        for other in others:
+            counts = counts + other.counts
+            total += other.count
+        if total == 0:
+            return [float('nan')] * len(qs)
+        cumulative = np.cumsum(counts)
+        indices = np.searchsorted(cumulative, [q * (total - 1) for q in qs], side='right')
+        # Bucket i holds (gamma^(i-1), gamma^i]; report the value with equal relative error to both ends
+        return [2 * self.gamma ** (int(i) + self._offset) / (self.gamma + 1) for i in indices]
+
+class ThroughputMeter:
+    """Step-time telemetry derived from successive log calls
+    
+    Each call to ``update`` with a step beyond the previous one yields the
+    per-step wall time over the interval, steps/sec, samples/sec (given a
+    batch size), the p50/p95/p99 step time over roughly the last ``window``
+    steps and the ETA to ``num_epochs``. Calls that do not advance the step
+    (epoch-end or validation entries) only reset the clock, so their
+    overhead is not counted as step latency. A new epoch or a step below the
+    previous one (steps numbered per epoch) re-baselines the clock and step
+    without timing the interval across the boundary.
+    """
+    
+    QUANTILES = (0.5, 0.95, 0.99)
+    # Rolling quantiles are refreshed every this many updates
+    QUANTILE_REFRESH = 16
+    
+    def __init__(self, batch_size: Optional[int] = None, num_epochs: Optional[int] = None,
+                 steps_per_epoch: Optional[int] = None, window: int = 1000):
+        self.batch_size = batch_size
+        self.num_epochs = num_epochs
+        self.steps_per_epoch = steps_per_epoch
+        self.window = window
+        self.step_time = RunningStats()
+        self.run_sketch = QuantileSketch()
+        self._active = QuantileSketch()
+        self._previous = QuantileSketch()
+        self._updates = 0
+        self._rolling = [float('nan')] * len(self.QUANTILES)
+        self._first_time: Optional[float] = None
+        self._first_epoch: Optional[int] = None
+        self._last_time: Optional[float] = None
+        self._last_step: Optional[int] = None
+        self._last_epoch: Optional[int] = None
+        self._estimated_steps_per_epoch: Optional[float] = None
+        # Steps advanced since the first update, across per-epoch step resets
+        self._progress = 0
+    
+    def update(self, step: int, epoch: int, now: Optional[float] = None) -> Dict[str, float]:
+        """Record that training reached ``step``; returns the throughput metrics"""
+        now = time.perf_counter() if now is None else now
+        if self._last_step is None:
+            self._first_time, self._first_epoch = now, epoch
+            self._last_time, self._last_step, self._last_epoch = now, step, epoch
+            return {}
+        
+        advanced = step - self._last_step
+        elapsed = now - self._last_time
+        self._last_time = now
+        if epoch != self._last_epoch or advanced < 0:
+            # Re-baseline at the boundary; steps may restart from 0 each epoch
+            self._progress += max(advanced, 0)
+            if epoch != self._last_epoch and self.steps_per_epoch is None and epoch > self._first_epoch:
+                # The first step of a new epoch gives the epoch length
+                self._estimated_steps_per_epoch = self._progress / (epoch - self._first_epoch)
+            self._last_step, self._last_epoch = step, epoch
+            return {}
+        if advanced == 0:
+            return {}
+        self._last_step = step
+        self._progress += advanced
+        
+        step_time = elapsed / advanced
+        self.step_time.add(step_time)
+        self.run_sketch.add(step_time, advanced)
+        self._active.add(step_time, advanced)
+        if self._active.count >= self.window:
+            self._active, self._previous = self._previous, self._active
+            self._active.clear()
+        self._updates += 1
+        if (self._updates - 1) % self.QUANTILE_REFRESH == 0:
+            self._rolling = self._active.quantiles(self.QUANTILES, (self._previous,))
+        
+        metrics = {
+            'step_time': step_time,
+            'steps_per_sec': advanced / elapsed if elapsed > 0 else float('nan'),
+            'step_time_p50': self._rolling[0],
+            'step_time_p95': self._rolling[1],
+            'step_time_p99': self._rolling[2],
+        }
+        if self.batch_size:
+            metrics['samples_per_sec'] = metrics['steps_per_sec'] * self.batch_size
+        eta = self.eta_seconds
+        if eta is not None:
+            metrics['eta_seconds'] = eta
+        return metrics
+    
+    @property
+    def overall_steps_per_sec(self) -> Optional[float]:
+        if self._last_step is None or self._last_time <= self._first_time:
+            return None
+        return self._progress / (self._last_time - self._first_time)
+    
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Seconds until ``num_epochs`` complete at the average rate so far"""
+        steps_per_epoch = self.steps_per_epoch or self._estimated_steps_per_epoch
+        rate = self.overall_steps_per_sec
+        if not (self.num_epochs and steps_per_epoch and rate):
+            return None
+        total_steps = (self.num_epochs - self._first_epoch) * steps_per_epoch
+        return max(total_steps - self._progress, 0) / rate
+    
+    def summary(self) -> Dict[str, Any]:
+        """Run-level throughput: average rates and step-time distribution"""
+        rate = self.overall_steps_per_sec
+        p50, p95, p99 = self.run_sketch.quantiles(self.QUANTILES)
+        return {
+            'steps_per_sec': rate,
+            'samples_per_sec': rate * self.batch_size if rate is not None and self.batch_size else None,
+            'step_time': self.step_time.as_dict() if self.step_time.count else None,
+            'step_time_p50': p50 if self.run_sketch.count else None,
+            'step_time_p95': p95 if self.run_sketch.count else None,
+            'step_time_p99': p99 if self.run_sketch.count else None,
+            'eta_seconds': self.eta_seconds,
+        }
+
+class PhaseStats:
+    """Count, total, maximum and a log-scale histogram of a phase's durations in ns
+    
+    The histogram has four buckets per power of two (about 19% wide), so
+    quantiles cost no per-event storage.
+    """
+    
+    __slots__ = ('count', 'total', 'max', 'hist')
+    
+    BUCKETS = 4 * 64
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.hist = [0] * self.BUCKETS
+    
+    def add(self, ns: int):
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        bits = ns.bit_length()
+        self.hist[(bits << 2) | ((ns >> (bits - 3)) & 3) if bits >= 3 else bits << 2] += 1
+    
+    def merge(self, other: 'PhaseStats'):
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.hist = [a + b for a, b in zip(self.hist, other.hist)]
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate quantile in ns (midpoint of the containing bucket)"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, count in enumerate(self.hist):
+            seen += count
+            if seen > rank:
+                bits, quarter = divmod(index, 4)
+                if bits < 3:
+                    return float(2 ** max(bits - 1, 0))
+                low = (4 + quarter) << (bits - 3)
+                return min(low + (1 << (bits - 3)) / 2, self.max)
+        return float(self.max)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        p50, p95 = self.quantile(0.5), self.quantile(0.95)
+        return {
+            'count': self.count,
+            'total_seconds': self.total / 1e9,
+            'mean_us': self.total / self.count / 1e3 if self.count else None,
+            'p50_us': p50 / 1e3 if p50 is not None else None,
+            'p95_us': p95 / 1e3 if p95 is not None else None,
+            'max_us': self.max / 1e3 if self.count else None,
+        }
+
+class _ThreadPhaseStats(PhaseStats):
+    """One thread's durations for a phase plus its stack of open starts"""
+    
+    __slots__ = ('stack',)
+    
+    def __init__(self):
+        super().__init__()
+        self.stack: List[Any] = []
+
+class _PhaseShard(threading.local):
+    """Per-thread stats of a phase timer, registered with it on first use"""
+    
+    def __init__(self, timer: '_PhaseTimer'):
+        self.stats = _ThreadPhaseStats()
+        timer._register(self.stats)
+
+class _PhaseTimer(PhaseStats):
+    """Reusable context manager and decorator accumulating one phase's durations
+    
+    Each thread keeps its own start stack and stats, so the same phase can
+    be timed from several threads at once or nested within itself without
+    taking a lock. ``collect`` folds what the threads recorded since the
+    last call into the timer's own stats.
+    """
+    
+    __slots__ = ('name', '_shard', '_shards', '_lock')
+    
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+        self._lock = threading.Lock()
+        self._shards: List[tuple] = []  # (thread stats, stats already collected)
+        self._shard = _PhaseShard(self)
+    
+    def _register(self, stats: PhaseStats):
+        with self._lock:
+            self._shards.append((stats, PhaseStats()))
+    
+    def add(self, ns: int):
+        self._shard.stats.add(ns)
+    
+    def collect(self):
+        """Fold durations recorded by all threads since the last call into these stats"""
+        with self._lock:
+            for stats, taken in self._shards:
+                # Owners update their stats concurrently: fold the growth since
+                # the previous snapshot, so an update in flight is picked up next time
+                count, total, hist = stats.count, stats.total, list(stats.hist)
+                self.count += count - taken.count
+                self.total += total - taken.total
+                self.hist = [a + b - c for a, b, c in zip(self.hist, hist, taken.hist)]
+                maximum, stats.max = stats.max, 0
+                self.max = max(self.max, maximum)
+                taken.count, taken.total, taken.hist = count, total, hist
+    
+    def __enter__(self):
+        self._shard.stats.stack.append(time.perf_counter_ns())
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        stats = self._shard.stats
+        ns = time.perf_counter_ns() - stats.stack.pop()
+        # PhaseStats.add inlined: this runs once per phase per step
+        stats.count += 1
+        stats.total += ns
+        if ns > stats.max:
+            stats.max = ns
+        bits = ns.bit_length()
+        stats.hist[(bits << 2) | ((ns >> (bits - 3)) & 3) if bits >= 3 else bits << 2] += 1
+        return False
+    
+    def __call__(self, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self:
+                return fn(*args, **kwargs)
+        return wrapper
+
+class _CudaPhaseTimer(_PhaseTimer):
+    """Phase timer recording CUDA events, resolved when the epoch's breakdown is read
+    
+    Events come from a pool and are returned to it once resolved, so timing
+    a phase never synchronizes the device or allocates per call.
+    """
+    
+    __slots__ = ('_torch', '_pool', '_pending')
+    
+    def __init__(self, name: str, torch_module):
+        super().__init__(name)
+        self._torch = torch_module
+        self._pool: List[Any] = []
+        self._pending: List[tuple] = []
+    
+    def _event(self):
+        try:
+            return self._pool.pop()
+        except IndexError:
+            return self._torch.cuda.Event(enable_timing=True)
+    
+    def __enter__(self):
+        start = self._event()
+        start.record()
+        self._shard.stats.stack.append(start)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        end = self._event()
+        end.record()
+        self._pending.append((self._shard.stats.stack.pop(), end))
+        return False
+    
+    def resolve(self):
+        """Fold recorded event pairs into the stats (waits for them to complete)"""
+        for start, end in self._pending:
+            end.synchronize()
+            self.add(int(start.elapsed_time(end) * 1e6))
+            self._pool.extend((start, end))
+        self._pending.clear()
+
+class PhaseProfiler:
+    """Aggregates named phase durations (data loading, forward, backward, ...)
+    
+    ``phase(name)`` returns a cached timer usable as a context manager or a
+    decorator; each use adds one duration to the phase's histogram (no
+    per-event objects), costing under a microsecond. ``end_epoch``
+    closes the current epoch's breakdown and folds it into the run totals.
+    
+    With ``cuda=True`` and PyTorch with a GPU available, phases are timed
+    with CUDA events, which measure device time without synchronizing on
+    every phase; otherwise CPU timers are used.
+    """
+    
+    def __init__(self, cuda: bool = False):
+        self._torch = None
+        if cuda:
+            if TORCH_AVAILABLE:
+                import torch
+                if torch.cuda.is_available():
+                    self._torch = torch
+            if self._torch is None:
+                logger.info("CUDA not available; timing phases with CPU timers")
+        self._timers: Dict[str, _PhaseTimer] = {}
+        self.totals: Dict[str, PhaseStats] = {}
+        self.epochs: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    
+    @property
+    def uses_cuda(self) -> bool:
+        return self._torch is not None
+    
+    def phase(self, name: str) -> _PhaseTimer:
+        """Timer for ``name``: ``with profiler.phase('forward'):`` or ``@profiler.phase('forward')``"""
+        timer = self._timers.get(name)
+        if timer is None:
+            if self._torch is not None:
+                timer = _CudaPhaseTimer(name, self._torch)
+            else:
+                timer = _PhaseTimer(name)
+            # Threads creating the same phase concurrently share the first timer
+            timer = self._timers.setdefault(name, timer)
+        return timer
+    
+    def iterate(self, name: str, iterable):
+        """Yield from ``iterable``, timing each ``next()`` as phase ``name``"""
+        timer = self.phase(name)
+        iterator = iter(iterable)
+        while True:
+            # Host-side fetch timed on the CPU; the final StopIteration is not recorded
+            start = time.perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            timer.add(time.perf_counter_ns() - start)
+            yield item
+    
+    def current(self) -> Dict[str, Dict[str, Any]]:
+        """Breakdown of the epoch in progress"""
+        for timer in self._timers.values():
+            if isinstance(timer, _CudaPhaseTimer):
+                timer.resolve()
+            timer.collect()
+        return {name: timer.as_dict() for name, timer in self._timers.items() if timer.count}
+    
+    def end_epoch(self, epoch: int) -> Dict[str, Dict[str, Any]]:
+        """Close the current epoch: record its breakdown and add it to the run totals"""
+        breakdown = self.current()
+        if not breakdown:
+            return breakdown
+        total = sum(stats['total_seconds'] for stats in breakdown.values())
+        for name, stats in breakdown.items():
+            stats['fraction'] = stats['total_seconds'] / total if total else None
+            timer = self._timers[name]
+            with timer._lock:
+                self.totals.setdefault(name, PhaseStats()).merge(timer)
+                timer.reset()
+        self.epochs[epoch] = breakdown
+        return breakdown
+    
+    def summary(self) -> Dict[str, Any]:
+        """Run totals per phase plus the per-epoch breakdowns"""
+        self.current()  # resolve pending CUDA events
+        totals: Dict[str, PhaseStats] = {}
+        for name, stats in [*self.totals.items(), *self._timers.items()]:
+            totals.setdefault(name, PhaseStats()).merge(stats)
+        return {
+            'total': {name: stats.as_dict() for name, stats in totals.items() if stats.count},
+            'epochs': self.epochs,
+        }
+
+RESOURCE_METRICS = (
+    'cpu_percent', 'rss_bytes', 'open_fds', 'read_bytes', 'write_bytes',
+    'cuda_allocated_bytes', 'cuda_reserved_bytes'
+)
+
+class ResourceSampler:
+    """Background thread sampling this process's resource usage into a TimeSeriesBuffer
+    
+    Every ``interval`` seconds it records CPU% (user + system time over wall
+    time, so above 100 with several busy threads), RSS, open file
+    descriptors and cumulative disk read/write bytes from ``/proc/self``,
+    plus allocated and reserved CUDA memory when PyTorch has already
+    initialized CUDA. The ``/proc`` files are kept open and re-read with
+    ``pread``. Anything unavailable on the platform is recorded as NaN.
+    """
+    
+    def __init__(self, series: 'TimeSeriesBuffer', interval: float = 1.0):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval!r}")
+        self.series = series
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._page_size = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+        self._fds = {name: self._open(f'/proc/self/{name}') for name in ('stat', 'io')}
+        self._last_cpu: Optional[float] = None
+        self._last_time: Optional[float] = None
+    
+    @staticmethod
+    def _open(path: str) -> Optional[int]:
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+    
+    def _read(self, name: str) -> Optional[bytes]:
+        fd = self._fds.get(name)
+        if fd is None:
+            return None
+        try:
+            return os.pread(fd, 4096, 0)
+        except OSError:
+            return None
+    
+    def sample(self) -> Dict[str, float]:
+        """Read the current resource usage"""
+        now = time.monotonic()
+        times = os.times()
+        cpu = times.user + times.system
+        values = {}
+        if self._last_time is not None and now > self._last_time:
+            values['cpu_percent'] = 100.0 * (cpu - self._last_cpu) / (now - self._last_time)
+        self._last_cpu, self._last_time = cpu, now
+        
+        stat = self._read('stat')
+        if stat:
+            # Fields after the parenthesized command name start at field 3 (state); rss is field 24
+            fields = stat[stat.rindex(b')') + 2:].split()
+            values['rss_bytes'] = float(int(fields[21]) * self._page_size)
+        
+        io = self._read('io')
+        if io:
+            counters = dict(line.split(b': ') for line in io.splitlines() if b': ' in line)
+            values['read_bytes'] = float(counters.get(b'read_bytes', b'nan'))
+            values['write_bytes'] = float(counters.get(b'write_bytes', b'nan'))
+        
+        try:
+            values['open_fds'] = float(len(os.listdir('/proc/self/fd')))
+        except OSError:
+            pass
+        
+        # Only query CUDA if the training code already initialized it
+        torch = sys.modules.get('torch')
+        if torch is not None and torch.cuda.is_available() and torch.cuda.is_initialized():
+            values['cuda_allocated_bytes'] = float(torch.cuda.memory_allocated())
+            values['cuda_reserved_bytes'] = float(torch.cuda.memory_reserved())
+        return values
+    
+    def start(self):
+        """Start sampling in a daemon thread"""
+        if self._thread is not None:
+            return
+        self.sample()  # baseline for the first CPU% reading
+        self._thread = threading.Thread(target=self._run, name='resource-sampler', daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.series.append(self.sample())
+    
+    def stop(self):
+        """Stop the thread after recording a final sample"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.series.append(self.sample())
+        for name, fd in self._fds.items():
+            if fd is not None:
+                os.close(fd)
+        self._fds = {}
+
+class MetricMonitor:
+    """Incrementally tracks the best value of one metric
+    
+    ``mode`` is ``'min'`` or ``'max'``. With ``smoothing > 1`` the best is
+    taken over the moving average of the last ``smoothing`` values rather
+    than over raw values.
+    """
+    
+    MODES = ('min', 'max')
+    
+    def __init__(self, name: str, mode: str = 'min', smoothing: int = 1):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown monitor mode {mode!r}, expected one of {self.MODES}")
+        if smoothing < 1:
+            raise ValueError(f"smoothing must be at least 1, got {smoothing}")
+        self.name = name
+        self.mode = mode
+        self.smoothing = smoothing
+        self.best: Optional[float] = None
+        self.best_epoch: Optional[int] = None
+        self.best_step: Optional[int] = None
+        self._window: deque = deque(maxlen=smoothing)
+    
+    def _is_better(self, value: float) -> bool:
+        if self.best is None:
+            return True
+        return value < self.best if self.mode == 'min' else value > self.best
+    
+    def update(self, value: float, epoch: int, step: int) -> bool:
+        """Add one value; returns True if it set a new best"""
+        if value != value:
+            # NaN is a missing value, as in update_batch
+            return False
+        if self.smoothing > 1:
+            self._window.append(value)
+            value = sum(self._window) / len(self._window)
+        if self._is_better(value):
+            self.best, self.best_epoch, self.best_step = float(value), int(epoch), int(step)
+            return True
+        return False
+    
+    def update_batch(self, values: np.ndarray, epochs: np.ndarray, steps: np.ndarray) -> bool:
+        """Add a block of values (NaN = missing); returns True if it set a new best"""
+        present = np.flatnonzero(~np.isnan(values))
+        if not len(present):
+            return False
+        candidates = values[present]
+        
+        if self.smoothing > 1:
+            # Moving averages continuing from the values already in the window
+            history = np.fromiter(self._window, dtype=np.float64, count=len(self._window))
+            series = np.concatenate((history, candidates))
+            cumsum = np.concatenate(([0.0], np.cumsum(series)))
+            end = np.arange(len(history) + 1, len(series) + 1)
+            start = np.maximum(end - self.smoothing, 0)
+            self._window.extend(candidates[-self.smoothing:])
+            candidates = (cumsum[end] - cumsum[start]) / (end - start)
+        
+        i = int(np.argmin(candidates) if self.mode == 'min' else np.argmax(candidates))
+        if self._is_better(candidates[i]):
+            row = present[i]
+            self.best, self.best_epoch, self.best_step = float(candidates[i]), int(epochs[row]), int(steps[row])
+            return True
+        return False
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'value': self.best,
+            'epoch': self.best_epoch,
+            'step': self.best_step,
+            'mode': self.mode,
+            'smoothing': self.smoothing
+        }
+
+
+# Segments created (and registered with the resource tracker) by this process
+_OWNED_SEGMENTS: Set[str] = set()
+
+
+class SharedMetricsRing:
+    """MetricsStorage ring buffers in a named shared-memory segment
+    
+    The writing MetricsStorage keeps its columns directly in the segment, so
+    external processes (e.g. a dashboard) can ``attach`` by experiment name
+    and read the latest steps without touching the writer's lock. A seqlock
+    in the header keeps reads consistent: the writer makes the sequence
+    number odd while it writes and even again afterwards, and readers retry
+    when it was odd or changed while they copied their rows.
+    
+    Layout: a 4 KiB header (int64 fields followed by a JSON list of
+    additional metric names), then one ``capacity``-long column per core
+    field and ``extra_slots`` float64 columns for additional metrics.
+    """
+    
+    HEADER_SIZE = 4096
+    _MAGIC = 0x4D4C5452
+    _SEQ, _CAPACITY, _HEAD, _SIZE, _TOTAL, _EXTRA_SLOTS, _N_EXTRA, _NAMES_LEN = range(1, 9)
+    _NAMES_OFFSET = 128
+    
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        self.header = np.ndarray((self._NAMES_OFFSET // 8,), dtype=np.int64, buffer=shm.buf)
+        if self.header[0] != self._MAGIC:
+            raise ValueError(f"Shared memory segment {shm.name} does not hold a metrics ring")
+        self.capacity = int(self.header[self._CAPACITY])
+        
+        offset = self.HEADER_SIZE
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, dtype in MetricsStorage.CORE_COLUMNS.items():
+            self.columns[name] = np.ndarray((self.capacity,), dtype=dtype, buffer=shm.buf, offset=offset)
+            offset += self.capacity * 8
+        self._extra_columns = [
+            np.ndarray((self.capacity,), dtype=np.float64, buffer=shm.buf, offset=offset + i * self.capacity * 8)
+            for i in range(int(self.header[self._EXTRA_SLOTS]))
+        ]
+        self._extra_names: List[str] = []
+        self._writes = 0
+    
+    @staticmethod
+    def segment_name(experiment_name: str) -> str:
+        """Shared memory name for an experiment (short enough for every platform)"""
+        return 'mlt_' + hashlib.sha1(experiment_name.encode()).hexdigest()[:24]
+    
+    @classmethod
+    def create(cls, experiment_name: str, capacity: int, extra_slots: int = 16) -> 'SharedMetricsRing':
+        """Create the segment for an experiment
+        
+        Raises FileExistsError when the segment already exists: another run
+        may still be writing it. Use ``remove`` to clean up after a crash.
+        """
+        name = cls.segment_name(experiment_name)
+        size = cls.HEADER_SIZE + (len(MetricsStorage.CORE_COLUMNS) + extra_slots) * capacity * 8
+        try:
+            shm = shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            raise FileExistsError(
+                f"Shared metrics segment {name} for experiment {experiment_name!r} already exists; "
+                f"another run may be using it. Pick a different experiment name or, if the run "
+                f"crashed, call SharedMetricsRing.remove({experiment_name!r})"
+            ) from None
+        _OWNED_SEGMENTS.add(name)
+        
+        header = np.ndarray((cls._NAMES_OFFSET // 8,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[cls._CAPACITY] = capacity
+        header[cls._EXTRA_SLOTS] = extra_slots
+        header[0] = cls._MAGIC
+        del header
+        return cls(shm, owner=True)
+    
+    @classmethod
+    def attach(cls, experiment_name: str) -> 'SharedMetricsRing':
+        """Attach read-only to the ring of a running experiment"""
+        name = cls.segment_name(experiment_name)
+        # Readers must not stay registered, or their resource tracker would
+        # unlink the writer's segment when they exit
+        try:
+            shm = shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            # Python < 3.13 has no track argument
+            shm = shared_memory.SharedMemory(name)
+            # The writer's own registration is shared with in-process readers
+            if os.name == 'posix' and name not in _OWNED_SEGMENTS:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+    
+    @classmethod
+    def remove(cls, experiment_name: str) -> bool:
+        """Unlink the segment left behind by a crashed run; False if there is none"""
+        try:
+            shm = shared_memory.SharedMemory(cls.segment_name(experiment_name))
+        except FileNotFoundError:
+            return False
+        shm.close()
+        shm.unlink()
+        _OWNED_SEGMENTS.discard(shm.name)
+        return True
+    
+    def begin_write(self):
+        """Mark the ring as being written (odd sequence number)"""
+        self.header[self._SEQ] = 2 * self._writes + 1
+    
+    def end_write(self, head: int, size: int, total_steps: int):
+        """Publish the new ring position (even sequence number)"""
+        header = self.header
+        header[self._HEAD] = head
+        header[self._SIZE] = size
+        header[self._TOTAL] = total_steps
+        self._writes += 1
+        header[self._SEQ] = 2 * self._writes
+    
+    def add_extra(self, key: str) -> Optional[np.ndarray]:
+        """Assign a free slot to an additional metric (writer, inside a write)"""
+        names = json.dumps(self._extra_names + [key]).encode()
+        if len(self._extra_names) >= len(self._extra_columns) or len(names) > self.HEADER_SIZE - self._NAMES_OFFSET:
+            return None
+        column = self._extra_columns[len(self._extra_names)]
+        column[:] = np.nan
+        self._extra_names.append(key)
+        self._shm.buf[self._NAMES_OFFSET:self._NAMES_OFFSET + len(names)] = names
+        self.header[self._NAMES_LEN] = len(names)
+        self.header[self._N_EXTRA] = len(self._extra_names)
+        return column
+    
+    def _read_names(self, length: int) -> List[str]:
+        if not length:
+            return []
+        return json.loads(bytes(self._shm.buf[self._NAMES_OFFSET:self._NAMES_OFFSET + length]))
+    
+    @property
+    def total_steps(self) -> int:
+        """Number of steps ever written by the writer"""
+        return int(self.header[self._TOTAL])
+    
+    def read_recent(self, n: int = 10, timeout: float = 1.0) -> Dict[str, np.ndarray]:
+        """Consistent copy of the latest n rows (all rows when n <= 0) as column arrays
+        
+        Only the requested rows are copied. Raises TimeoutError if the writer
+        keeps the ring busy for ``timeout`` seconds.
+        """
+        header = self.header
+        deadline = time.monotonic() + timeout
+        while True:
+            seq = int(header[self._SEQ])
+            if not seq & 1:
+                head = int(header[self._HEAD])
+                size = int(header[self._SIZE])
+                names_length = int(header[self._NAMES_LEN])
+                n_extra = int(header[self._N_EXTRA])
+                count = size if n <= 0 else min(n, size)
+                indices = (head - count + np.arange(count)) % self.capacity
+                
+                result = {name: column[indices] for name, column in self.columns.items()}
+                extras = [column[indices] for column in self._extra_columns[:n_extra]]
+                try:
+                    names = self._read_names(names_length)
+                except ValueError:
+                    names = None
+                if names is not None and int(header[self._SEQ]) == seq:
+                    result['timestamp'] = result['timestamp'].view('datetime64[us]')
+                    result.update(zip(names, extras))
+                    return result
+            if time.monotonic() > deadline:
+                raise TimeoutError("Timed out waiting for a consistent read of the metrics ring")
+            time.sleep(0)
+    
+    def get_recent_metrics(self, n: int = 10) -> List[TrainingMetrics]:
+        """Latest n rows as TrainingMetrics objects"""
+        rows = self.read_recent(n)
+        core = set(MetricsStorage.CORE_COLUMNS)
+        
+        def optional(value):
+            return None if np.isnan(value) else float(value)
+        
+        return [
+            TrainingMetrics(
+                epoch=int(rows['epoch'][i]),
+                step=int(rows['step'][i]),
+                loss=optional(rows['loss'][i]),
+                accuracy=optional(rows['accuracy'][i]),
+                val_loss=optional(rows['val_loss'][i]),
+                val_accuracy=optional(rows['val_accuracy'][i]),
+                learning_rate=optional(rows['learning_rate'][i]),
+                timestamp=rows['timestamp'][i].astype(datetime),
+                additional_metrics={
+                    key: float(values[i]) for key, values in rows.items()
+                    if key not in core and not np.isnan(values[i])
+                }
+            )
+            for i in range(len(rows['step']))
+        ]
+    
+    def close(self):
+        """Detach from the segment, removing it if this is the writer"""
+        self.header = None
+        self.columns = {}
+        self._extra_columns = []
+        try:
+            self._shm.close()
+        except BufferError:
+            # Arrays handed out earlier still map the segment; it is freed with them
+            pass
+        if self.owner:
+            _OWNED_SEGMENTS.discard(self._shm.name)
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+class TimeSeriesBuffer:
+    """Fixed-capacity ring of timestamped samples of float columns
+    
+    Used for series sampled by wall time rather than per step. Timestamps
+    follow MetricsStorage's convention (microseconds of local wall-clock
+    time, exposed as ``datetime64[us]``), so samples can be aligned with
+    metric rows by time.
+    """
+    
+    def __init__(self, columns: List[str], capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be a positive integer, got {capacity!r}")
+        self.columns = tuple(columns)
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        self._values = np.full((capacity, len(self.columns)), np.nan)
+        self._head = 0
+        self._size = 0
+        self.lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, values: Dict[str, float], timestamp: Optional[datetime] = None):
+        """Add one sample; columns missing from ``values`` are stored as NaN"""
+        timestamp_us = MetricsStorage._to_timestamp_us(timestamp or datetime.now())
+        row = [values.get(name, np.nan) for name in self.columns]
+        with self.lock:
+            self._timestamps[self._head] = timestamp_us
+            self._values[self._head] = row
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+    
+    def get_arrays(self) -> Dict[str, np.ndarray]:
+        """Samples oldest first: ``timestamp`` plus one array per column"""
+        with self.lock:
+            order = np.arange(self._head - self._size, self._head) % self.capacity
+            timestamps = self._timestamps[order]
+            values = self._values[order]
+        arrays = {'timestamp': timestamps.view('datetime64[us]')}
+        arrays.update((name, values[:, i]) for i, name in enumerate(self.columns))
+        return arrays
+
 class MetricsStorage:
-    """Thread-safe storage for training metrics"""
+    """Thread-safe columnar storage for training metrics
+    
+    Metrics are kept in preallocated NumPy ring buffers, one per core field
+    plus one per ``additional_metrics`` key discovered at runtime. Missing
+    values are stored as NaN, so a step costs a few bytes per column instead
+    of a full ``TrainingMetrics`` object. Running aggregates over every step
+    ever added (not just the retained window) are maintained on append, as
+    are the best values of every metric registered with ``monitor`` (loss
+    and accuracy by default).
+    
+    With ``sharded=True`` producer threads append to their own unlocked
+    buffers instead of contending on ``lock``. Buffered entries are merged
+    into the columns, ordered by ``(step, timestamp)``, and reduced into
+    ``best_metrics`` whenever a reader queries the storage.
+    
+    With ``shared_name`` the ring buffers live in a SharedMetricsRing that
+    other processes can attach to by that name (additional metrics beyond
+    ``shared_extra_slots`` stay in process memory).
     
-    def __init__(self, max_history: int = 1000):
+    Series sampled by time rather than per step (such as resource usage)
+    are kept separately in named TimeSeriesBuffers (``add_time_series``).
+    """
+    
+    # Core columns and their storage dtypes. Timestamps are stored as
+    # microseconds since the epoch of the (naive, local) wall-clock time.
+    CORE_COLUMNS = {
+        'epoch': np.int64,
+        'step': np.int64,
+        'loss': np.float64,
+        'accuracy': np.float64,
+        'val_loss': np.float64,
+        'val_accuracy': np.float64,
+        'learning_rate': np.float64,
+        'timestamp': np.int64,
+    }
+    OPTIONAL_COLUMNS = ('accuracy', 'val_loss', 'val_accuracy', 'learning_rate')
+    
+    def __init__(self, max_history: int = 1000, sharded: bool = False,
+                 shared_name: Optional[str] = None, shared_extra_slots: int = 16):
+        if max_history is None or max_history <= 0:
+            raise ValueError(f"max_history must be a positive integer, got {max_history!r}")
         self.max_history = max_history
-        self.metrics_history: deque = deque(maxlen=max_history)
-        self.best_metrics: Dict[str, float] = {}
+        self.sharded = sharded
+        self._best_metrics: Dict[str, float] = {}
         self.lock = threading.Lock()
         
+        # Per-thread ingestion buffers used in sharded mode
+        self._local = threading.local()
+        self._shards: List[tuple] = []  # (thread, deque) pairs
+        
+        self._shared: Optional[SharedMetricsRing] = None
+        if shared_name is not None:
+            self._shared = SharedMetricsRing.create(shared_name, max_history, shared_extra_slots)
+            self._columns: Dict[str, np.ndarray] = dict(self._shared.columns)
+        else:
+            self._columns = {
+                name: np.zeros(max_history, dtype=dtype)
+                for name, dtype in self.CORE_COLUMNS.items()
+            }
+        self._additional_columns: Dict[str, np.ndarray] = {}
+        self._head = 0  # Next write position
+        self._size = 0  # Number of valid rows
+        self._version = 0  # Incremented on every write
+        self._snapshot: Optional[Dict[str, Any]] = None
+        
+        # Aggregates over every step ever added
+        self._total_steps = 0
+        self._max_epoch: Optional[int] = None
+        self._stats: Dict[str, RunningStats] = {}
+        self._monitors: Dict[str, MetricMonitor] = {}
+        self.monitor('loss', 'min')
+        self.monitor('accuracy', 'max')
+        self._time_series: Dict[str, TimeSeriesBuffer] = {}
+    
+    def __len__(self) -> int:
+        with self.lock:
+            self._merge_shards()
+            return self._size
+    
+    @property
+    def total_steps(self) -> int:
+        """Number of steps ever added, including those evicted from the window"""
+        with self.lock:
+            self._merge_shards()
+            return self._total_steps
+    
+    @property
+    def max_epoch(self) -> Optional[int]:
+        """Highest epoch ever added"""
+        with self.lock:
+            self._merge_shards()
+            return self._max_epoch
+    
+    def close(self):
+        """Release the shared memory segment, keeping the data in process memory"""
+        with self.lock:
+            shared, self._shared = self._shared, None
+            if shared is None:
+                return
+            self._merge_shards()
+            self._columns = {name: np.array(column) for name, column in self._columns.items()}
+            self._additional_columns = {
+                key: np.array(column) for key, column in self._additional_columns.items()
+            }
+            self._snapshot = None
+        shared.close()
+    
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Running count/mean/std/min/max/last of every metric over all steps"""
+        with self.lock:
+            self._merge_shards()
+            return {name: stats.as_dict() for name, stats in self._stats.items()}
+    
+    def _get_stats(self, name: str) -> RunningStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = RunningStats()
+            self._stats[name] = stats
+        return stats
+    
+    def monitor(self, name: str, mode: str = 'min', smoothing: int = 1) -> MetricMonitor:
+        """Register a metric whose best value is tracked on every append
+        
+        Registering an already monitored metric with the same settings is a
+        no-op; different settings replace the monitor. A new monitor is
+        seeded from the rows currently retained in the window.
+        """
+        with self.lock:
+            self._merge_shards()
+            existing = self._monitors.get(name)
+            if existing is not None and existing.mode == mode and existing.smoothing == smoothing:
+                return existing
+            
+            monitor = MetricMonitor(name, mode, smoothing)
+            self._monitors[name] = monitor
+            for key in ('', '_epoch', '_step'):
+                self._best_metrics.pop(f'best_{name}{key}', None)
+            if self._size:
+                indices = self._row_indices()
+                values = self._columns.get(name, self._additional_columns.get(name))
+                if values is not None and monitor.update_batch(
+                    values[indices], self._columns['epoch'][indices], self._columns['step'][indices]
+                ):
+                    self._publish_best(monitor)
+            return monitor
+    
+    def get_monitor(self, name: str) -> Optional[MetricMonitor]:
+        """Get the monitor registered for a metric, if any"""
+        return self._monitors.get(name)
+    
+    def get_best(self, name: str) -> Optional[Dict[str, Any]]:
+        """Best value of a monitored metric with its epoch and step, or None"""
+        with self.lock:
+            self._merge_shards()
+            monitor = self._monitors.get(name)
+            if monitor is None or monitor.best is None:
+                return None
+            return monitor.as_dict()
+    
+    def _publish_best(self, monitor: MetricMonitor):
+        """Mirror a monitor's best into best_metrics (lock must be held)"""
+        self._best_metrics[f'best_{monitor.name}'] = monitor.best
+        self._best_metrics[f'best_{monitor.name}_epoch'] = monitor.best_epoch
+        self._best_metrics[f'best_{monitor.name}_step'] = monitor.best_step
+    
+    @property
+    def best_metrics(self) -> Dict[str, float]:
+        """Best metrics seen so far"""
+        if self.sharded:
+            with self.lock:
+                self._merge_shards()
+        return self._best_metrics
+    
+    _EPOCH = datetime(1970, 1, 1)
+    _MICROSECOND = timedelta(microseconds=1)
+    
+    @classmethod
+    def _to_timestamp_us(cls, timestamp: datetime) -> int:
+        """Convert a datetime to integer microseconds of its wall-clock time"""
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone().replace(tzinfo=None)
+        return (timestamp - cls._EPOCH) // cls._MICROSECOND
+    
+    def _get_additional_column(self, key: str) -> np.ndarray:
+        """Get the ring buffer for an additional metric, creating it if needed"""
+        column = self._additional_columns.get(key)
+        if column is None:
+            if self._shared is not None:
+                column = self._shared.add_extra(key)
+                if column is None:
+                    logger.warning(f"No shared memory slot left for metric {key!r}; it stays in process")
+            if column is None:
+                column = np.full(self.max_history, np.nan, dtype=np.float64)
+            self._additional_columns[key] = column
+        return column
+    
     def add_metric(self, metric: TrainingMetrics):
         """Add a new metric to the history"""
+        if self.sharded:
+            self._get_shard().append(metric)
+            return
+        
         with self.lock:
-            self.metrics_history.append(metric)
+            self._append_row(metric)
             self._update_best_metrics(metric)
     
+    def add_metrics_batch(self, columns: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Add a block of metrics given as column arrays
+        
+        ``columns`` maps core field names and additional metric keys to
+        arrays of equal length; scalars are broadcast to the block length.
+        ``epoch``, ``step`` and ``loss`` are required and ``timestamp``
+        defaults to now. Best metrics are reduced over the block with
+        argmin/argmax. Returns the normalized column arrays.
+        """
+        data, additional = self._normalize_batch(columns)
+        with self.lock:
+            self._merge_shards()
+            self._append_columns(data, additional)
+            self._reduce_best_metrics(data, additional)
+        return {**data, **additional}
+    
+    @classmethod
+    def _normalize_batch(cls, columns: Dict[str, Any]):
+        """Convert batch columns to storage dtypes, split into core and additional"""
+        missing = [name for name in ('epoch', 'step', 'loss') if columns.get(name) is None]
+        if missing:
+            raise ValueError(f"Batch is missing required columns: {missing}")
+        
+        arrays = {
+            name: np.asarray(value)
+            for name, value in columns.items()
+            if value is not None and name != 'timestamp'
+        }
+        timestamp = columns.get('timestamp')
+        if timestamp is not None:
+            timestamp = np.asarray(timestamp)
+            arrays['timestamp'] = timestamp
+        
+        if any(array.ndim > 1 for array in arrays.values()):
+            raise ValueError("Batch columns must be scalars or 1-D arrays")
+        lengths = {len(array) for array in arrays.values() if array.ndim == 1}
+        if len(lengths) > 1:
+            raise ValueError(f"Batch columns have mismatched lengths: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 1
+        
+        def column(name, dtype):
+            array = arrays.get(name)
+            if array is None:
+                return np.full(n, np.nan, dtype=dtype)
+            return np.broadcast_to(array, (n,)).astype(dtype)
+        
+        data = {
+            name: column(name, dtype)
+            for name, dtype in cls.CORE_COLUMNS.items()
+            if name != 'timestamp'
+        }
+        if timestamp is None:
+            data['timestamp'] = np.full(n, cls._to_timestamp_us(datetime.now()), dtype=np.int64)
+        elif timestamp.dtype.kind == 'M':
+            data['timestamp'] = column('timestamp', 'datetime64[us]').view(np.int64)
+        elif timestamp.dtype == object:
+            data['timestamp'] = np.broadcast_to(
+                np.array([cls._to_timestamp_us(t) for t in timestamp.ravel()], dtype=np.int64), (n,)
+            ).copy()
+        else:
+            raise TypeError("Batch timestamps must be datetimes or datetime64 values")
+        
+        additional = {
+            name: column(name, np.float64)
+            for name in arrays
+            if name not in cls.CORE_COLUMNS
+        }
+        return data, additional
+    
+    def _get_shard(self) -> deque:
+        """Get the calling thread's ingestion buffer, registering it if needed"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = deque()
+            self._local.shard = shard
+            with self.lock:
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+    
+    def _merge_shards(self):
+        """Merge buffered per-thread entries into the columns (lock must be held)"""
+        if not self._shards:
+            return
+        
+        pending = []
+        alive = []
+        for thread, shard in self._shards:
+            # deque.popleft is atomic, so producers can keep appending meanwhile
+            for _ in range(len(shard)):
+                pending.append(shard.popleft())
+            if thread.is_alive() or shard:
+                alive.append((thread, shard))
+        self._shards = alive
+        
+        if not pending:
+            return
+        
+        data, additional = self.metrics_to_columns(pending)
+        order = np.lexsort((data['timestamp'], data['step']))
+        data = {name: column[order] for name, column in data.items()}
+        additional = {key: column[order] for key, column in additional.items()}
+        self._append_columns(data, additional)
+        self._reduce_best_metrics(data, additional)
+    
+    @classmethod
+    def metrics_to_columns(cls, metrics: List[TrainingMetrics]):
+        """Convert TrainingMetrics objects to core and additional column arrays"""
+        n = len(metrics)
+        data = {
+            'epoch': np.fromiter((m.epoch for m in metrics), np.int64, n),
+            'step': np.fromiter((m.step for m in metrics), np.int64, n),
+            'timestamp': np.fromiter(
+                (cls._to_timestamp_us(m.timestamp) for m in metrics), np.int64, n
+            ),
+        }
+        # None converts to NaN in float64 arrays
+        for name in ('loss',) + cls.OPTIONAL_COLUMNS:
+            data[name] = np.array([getattr(m, name) for m in metrics], dtype=np.float64)
+        extras = [m.additional_metrics or {} for m in metrics]
+        keys = {key for extra in extras for key in extra}
+        additional = {
+            key: np.array([extra.get(key) for extra in extras], dtype=np.float64)
+            for key in keys
+        }
+        return data, additional
+    
+    def _append_columns(self, data: Dict[str, np.ndarray], additional: Dict[str, np.ndarray]):
+        """Write a block of rows into the ring buffers (lock must be held)"""
+        n = len(data['step'])
+        if n == 0:
+            return
+        
+        self._total_steps += n
+        batch_max_epoch = int(data['epoch'].max())
+        if self._max_epoch is None or batch_max_epoch > self._max_epoch:
+            self._max_epoch = batch_max_epoch
+        metrics = {name: data[name] for name in ('loss',) + self.OPTIONAL_COLUMNS}
+        for name, values in {**metrics, **additional}.items():
+            if not np.isnan(values).all():
+                self._get_stats(name).add_batch(values)
+        
+        if n > self.max_history:
+            # Only the newest rows survive; skip the ones that would be overwritten
+            skip = n - self.max_history
+            self._head = (self._head + skip) % self.max_history
+            data = {name: column[skip:] for name, column in data.items()}
+            additional = {key: column[skip:] for key, column in additional.items()}
+            n = self.max_history
+        
+        shared = self._shared
+        if shared is not None:
+            shared.begin_write()
+        indices = (self._head + np.arange(n)) % self.max_history
+        for name, column in self._columns.items():
+            column[indices] = data[name]
+        for key, column in self._additional_columns.items():
+            if key not in additional:
+                column[indices] = np.nan
+        for key, values in additional.items():
+            self._get_additional_column(key)[indices] = values
+        
+        self._head = (self._head + n) % self.max_history
+        self._size = min(self._size + n, self.max_history)
+        self._version += 1
+        if shared is not None:
+            shared.end_write(self._head, self._size, self._total_steps)
+    
+    def _reduce_best_metrics(self, data: Dict[str, np.ndarray], additional: Dict[str, np.ndarray]):
+        """Update monitored best metrics from a block of rows (lock must be held)"""
+        for name, monitor in self._monitors.items():
+            values = data.get(name, additional.get(name))
+            if values is None or name in ('epoch', 'step', 'timestamp'):
+                continue
+            if monitor.update_batch(values, data['epoch'], data['step']):
+                self._publish_best(monitor)
+    
+    def _append_row(self, metric: TrainingMetrics):
+        """Write a metric into the ring buffers (lock must be held)"""
+        i = self._head
+        columns = self._columns
+        shared = self._shared
+        if shared is not None:
+            shared.begin_write()
+        columns['epoch'][i] = metric.epoch
+        columns['step'][i] = metric.step
+        for name in ('loss',) + self.OPTIONAL_COLUMNS:
+            value = getattr(metric, name)
+            if value is None:
+                columns[name][i] = np.nan
+            else:
+                columns[name][i] = value
+                self._get_stats(name).add(value)
+        columns['timestamp'][i] = self._to_timestamp_us(metric.timestamp)
+        
+        additional = metric.additional_metrics or {}
+        for key, column in self._additional_columns.items():
+            if key not in additional:
+                column[i] = np.nan
+        for key, value in additional.items():
+            if value is None:
+                self._get_additional_column(key)[i] = np.nan
+            else:
+                self._get_additional_column(key)[i] = value
+                self._get_stats(key).add(value)
+        
+        self._total_steps += 1
+        if self._max_epoch is None or metric.epoch > self._max_epoch:
+            self._max_epoch = metric.epoch
+        self._head = (i + 1) % self.max_history
+        if self._size < self.max_history:
+            self._size += 1
+        self._version += 1
+        if shared is not None:
+            shared.end_write(self._head, self._size, self._total_steps)
+    
     def _update_best_metrics(self, metric: TrainingMetrics):
-        """Update best metrics seen so far"""
-        if metric.loss is not None:
-            current_best = self.best_metrics.get('best_loss', float('inf'))
-            if metric.loss < current_best:
-                self.best_metrics['best_loss'] = metric.loss
-                self.best_metrics['best_loss_epoch'] = metric.epoch
-                self.best_metrics['best_loss_step'] = metric.step
-        
-        if metric.accuracy is not None:
-            current_best = self.best_metrics.get('best_accuracy', 0.0)
-            if metric.accuracy > current_best:
-                self.best_metrics['best_accuracy'] = metric.accuracy
-                self.best_metrics['best_accuracy_epoch'] = metric.epoch
-                self.best_metrics['best_accuracy_step'] = metric.step
+        """Update monitored best metrics from one metric (lock must be held)"""
+        additional = metric.additional_metrics or {}
+        for name, monitor in self._monitors.items():
+            if name in self.CORE_COLUMNS:
+                value = getattr(metric, name) if name not in ('epoch', 'step', 'timestamp') else None
+            else:
+                value = additional.get(name)
+            if value is not None and monitor.update(value, metric.epoch, metric.step):
+                self._publish_best(monitor)
+    
+    def _row_indices(self, n: Optional[int] = None) -> np.ndarray:
+        """Physical buffer indices of the last n rows in insertion order"""
+        n = self._size if n is None else min(n, self._size)
+        start = (self._head - n) % self.max_history
+        return (start + np.arange(n)) % self.max_history
+    
+    def _row_to_metric(self, i: int) -> TrainingMetrics:
+        """Rebuild a TrainingMetrics object from buffer row i"""
+        columns = self._columns
+        
+        def optional(value):
+            return None if np.isnan(value) else float(value)
+        
+        timestamp_us = int(columns['timestamp'][i])
+        return TrainingMetrics(
+            epoch=int(columns['epoch'][i]),
+            step=int(columns['step'][i]),
+            loss=optional(columns['loss'][i]),
+            accuracy=optional(columns['accuracy'][i]),
+            val_loss=optional(columns['val_loss'][i]),
+            val_accuracy=optional(columns['val_accuracy'][i]),
+            learning_rate=optional(columns['learning_rate'][i]),
+            timestamp=self._EPOCH + timestamp_us * self._MICROSECOND,
+            additional_metrics={
+                key: float(column[i])
+                for key, column in self._additional_columns.items()
+                if not np.isnan(column[i])
+            }
+        )
     
     def get_recent_metrics(self, n: int = 10) -> List[TrainingMetrics]:
         """Get the n most recent metrics"""
         with self.lock:
-            return list(self.metrics_history)[-n:]
+            self._merge_shards()
+            if n <= 0:
+                n = self._size
+            return [self._row_to_metric(i) for i in self._row_indices(n)]
+    
+    def _snapshot_arrays(self) -> Dict[str, np.ndarray]:
+        """Read-only column arrays for all rows in insertion order (lock must be held)
+        
+        Columns are always copied: views of the live buffers would change
+        under callers holding them once the ring wraps.
+        """
+        n = self._size
+        if n < self.max_history:
+            def take(column):
+                return column[:n].copy()
+        else:
+            # Unwrap the ring with a single copy per column
+            head = self._head
+            def take(column):
+                return np.concatenate((column[head:], column[:head]))
+        
+        arrays = {name: take(column) for name, column in self._columns.items()}
+        arrays['timestamp'] = arrays['timestamp'].view('datetime64[us]')
+        for key, column in self._additional_columns.items():
+            arrays[key] = take(column)
+        for array in arrays.values():
+            array.flags.writeable = False
+        return arrays
+    
+    def _get_snapshot(self) -> Dict[str, Any]:
+        """Get the cached snapshot for the current version (lock must be held)"""
+        if self._snapshot is None or self._snapshot['version'] != self._version:
+            self._snapshot = {
+                'version': self._version,
+                'arrays': self._snapshot_arrays(),
+                'df': None
+            }
+        return self._snapshot
+    
+    def get_metrics_arrays(self, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """Get all metrics as read-only NumPy column arrays
+        
+        Each column is copied out of the ring once (unwrapping it if needed),
+        so the arrays stay valid after later writes. The result is cached
+        until the next metric is added.
+        """
+        with self.lock:
+            self._merge_shards()
+            if self._size == 0:
+                return {}
+            arrays = self._get_snapshot()['arrays']
+        if columns is None:
+            return dict(arrays)
+        return {name: arrays[name] for name in columns if name in arrays}
     
-    def get_metrics_df(self) -> pd.DataFrame:
-        """Get all metrics as a pandas DataFrame"""
+    def get_metrics_df(self) -> 'pd.DataFrame':
+        """Get all metrics as a pandas DataFrame
+        
+        The frame is built directly from the column arrays and cached until
+        the next metric is added. Each caller gets a shallow copy of the
+        cached frame, so repeated calls between writes cost O(columns) and
+        adding or editing columns in one result does not affect the others.
+        """
+        import pandas as pd
+        
         with self.lock:
-            if not self.metrics_history:
+            self._merge_shards()
+            if self._size == 0:
                 return pd.DataFrame()
             
-            data = []
-            for metric in self.metrics_history:
-                row = {
-                    'epoch': metric.epoch,
-                    'step': metric.step,
-                    'loss': metric.loss,
-                    'accuracy': metric.accuracy,
-                    'val_loss': metric.val_loss,
-                    'val_accuracy': metric.val_accuracy,
-                    'learning_rate': metric.learning_rate,
-                    'timestamp': metric.timestamp
-                }
-                row.update(metric.additional_metrics)
-                data.append(row)
+            snapshot = self._get_snapshot()
+            if snapshot['df'] is None:
+                snapshot['df'] = pd.DataFrame(snapshot['arrays'], copy=False)
+            return snapshot['df'].copy(deep=False)
+
+    def add_time_series(self, name: str, columns: List[str], capacity: int = 10000) -> TimeSeriesBuffer:
+        """Create (or return) the time-indexed series ``name``"""
+        series = self._time_series.get(name)
+        if series is None:
+            series = self._time_series[name] = TimeSeriesBuffer(columns, capacity)
+        return series
+    
+    def get_time_series(self, name: str) -> Dict[str, np.ndarray]:
+        """Samples of a time series as arrays (``timestamp`` is datetime64[us])"""
+        series = self._time_series.get(name)
+        return series.get_arrays() if series is not None else {}
+    
+    def get_time_series_df(self, name: str) -> 'pd.DataFrame':
+        """Samples of a time series as a DataFrame indexed by timestamp"""
+        import pandas as pd
+        
+        arrays = self.get_time_series(name)
+        if not arrays:
+            return pd.DataFrame()
+        return pd.DataFrame(arrays).set_index('timestamp')
+    
+    def get_time_series_at_steps(self, name: str) -> Dict[str, np.ndarray]:
+        """The latest sample of a time series at each stored metric row's timestamp
+        
+        Arrays line up with ``get_metrics_arrays()``; rows logged before the
+        first sample are NaN. Use it to correlate, e.g., RSS growth or I/O
+        stalls with loss spikes.
+        """
+        samples = self.get_time_series(name)
+        metric_timestamps = self.get_metrics_arrays(['timestamp']).get('timestamp')
+        if not samples or metric_timestamps is None:
+            return {}
+        index = np.searchsorted(samples['timestamp'], metric_timestamps, side='right') - 1
+        before_first = index < 0
+        index[before_first] = 0
+        aligned = {}
+        for column, values in samples.items():
+            if column == 'timestamp':
+                continue
+            column_values = values[index]
+            column_values[before_first] = np.nan
+            aligned[column] = column_values
+        return aligned
+
+class AsyncSinkWriter:
+    """Bounded queue drained by a background thread that flushes batches to sinks
+    
+    ``put`` only enqueues, so the caller never waits on sink I/O unless the
+    queue is full and the backpressure policy is ``'block'``. The other
+    policies never block: ``'drop_oldest'`` evicts the oldest queued entry,
+    and ``'sample'`` keeps only every ``sample_every``-th overflowing entry
+    (evicting the oldest) and drops the rest.
+    """
+    
+    BACKPRESSURE_POLICIES = ('block', 'drop_oldest', 'sample')
+    _SENTINEL = object()
+    
+    def __init__(
+        self,
+        flush_fn: Callable[[List[Any]], None],
+        max_queue_size: int = 10000,
+        backpressure: str = 'block',
+        batch_size: int = 256,
+        sample_every: int = 10
+    ):
+        if backpressure not in self.BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy {backpressure!r}, "
+                f"expected one of {self.BACKPRESSURE_POLICIES}"
+            )
+        self.flush_fn = flush_fn
+        self.backpressure = backpressure
+        self.batch_size = max(1, batch_size)
+        self.sample_every = max(1, sample_every)
+        self.dropped = 0
+        self._overflow = 0
+        self._closed = False
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name='AsyncSinkWriter', daemon=True)
+        self._thread.start()
+    
+    def put(self, item: Any):
+        """Enqueue an item for the background worker"""
+        if self._closed:
+            raise RuntimeError("AsyncSinkWriter is closed")
+        if self.backpressure == 'block':
+            self._queue.put(item)
+            return
+        
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        
+        if self.backpressure == 'sample':
+            self._overflow += 1
+            if self._overflow % self.sample_every:
+                self.dropped += 1
+                return
+        
+        while True:
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                continue
+    
+    def _run(self):
+        """Worker loop: collect up to batch_size queued items and flush them"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = any(item is self._SENTINEL for item in batch)
+            items = [item for item in batch if item is not self._SENTINEL]
+            try:
+                if items:
+                    self.flush_fn(items)
+            except Exception:
+                logger.exception("Failed to flush metrics to sinks")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+    
+    def flush(self):
+        """Block until every queued item has been flushed"""
+        self._queue.join()
+    
+    def close(self):
+        """Flush all queued items and stop the worker"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._SENTINEL)
+        self._thread.join()
+        if self.dropped:
+            logger.warning(f"AsyncSinkWriter dropped {self.dropped} entries under backpressure")
+
+class MetricsJournal:
+    """Append-only binary metrics journal for a single run
+    
+    The journal directory holds:
+    
+    - ``journal.json``: format version and the dtype of each core column
+    - ``<column>.bin``: one fixed-width little-endian array per core field,
+      so readers can map a single column without touching the others
+    - ``extra.bin``: ``(row, key, value)`` records for additional metrics
+    - ``keys.txt``: additional metric names as JSON strings, one per line;
+      the line number is the key id used in ``extra.bin``
+    - ``index.json``: row count and whether ``step``/``epoch`` are sorted,
+      rewritten at every fsync
+    
+    Appends are queued and written by a background thread, which flushes
+    each batch to the OS and fsyncs every ``fsync_interval`` seconds. Torn
+    trailing records left by a crash are discarded when the journal is
+    reopened with ``resume=True`` and ignored by readers. Opening an existing
+    journal without ``resume`` moves it aside (see ``_archive``) rather than
+    overwriting it.
+    """
+    
+    FORMAT = 'ml-training-tracker-journal'
+    VERSION = 2
+    COLUMN_DTYPES = {
+        'epoch': np.dtype('<i8'),
+        'step': np.dtype('<i8'),
+        'loss': np.dtype('<f8'),
+        'accuracy': np.dtype('<f8'),
+        'val_loss': np.dtype('<f8'),
+        'val_accuracy': np.dtype('<f8'),
+        'learning_rate': np.dtype('<f8'),
+        'timestamp': np.dtype('<i8'),
+    }
+    EXTRA_DTYPE = np.dtype([('row', '<i8'), ('key', '<i4'), ('value', '<f8')])
+    _SENTINEL = object()
+    
+    def __init__(self, directory: Union[str, Path], fsync_interval: float = 5.0, resume: bool = False):
+        self.directory = Path(directory)
+        if not resume and (self.directory / 'journal.json').exists():
+            self._archive()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fsync_interval = fsync_interval
+        self.extra_path = self.directory / 'extra.bin'
+        self.keys_path = self.directory / 'keys.txt'
+        
+        if resume and (self.directory / 'journal.json').exists():
+            self.rows = self._repair()
+            self.keys = self.read_keys(self.directory)
+            index = self.read_index(self.directory)
+        else:
+            with open(self.directory / 'journal.json', 'w') as f:
+                json.dump({
+                    'format': self.FORMAT,
+                    'version': self.VERSION,
+                    'columns': {name: dtype.str for name, dtype in self.COLUMN_DTYPES.items()}
+                }, f, indent=2)
+            for name in self.COLUMN_DTYPES:
+                self._column_path(self.directory, name).write_bytes(b'')
+            self.extra_path.write_bytes(b'')
+            self.keys_path.write_text('')
+            self.rows = 0
+            self.keys = []
+            index = self._empty_index()
+        
+        self._index = index
+        self._key_ids = {key: i for i, key in enumerate(self.keys)}
+        self._column_files = {
+            name: open(self._column_path(self.directory, name), 'ab')
+            for name in self.COLUMN_DTYPES
+        }
+        self._extra_file = open(self.extra_path, 'ab')
+        self._keys_file = open(self.keys_path, 'a')
+        self._write_index()
+        self._closed = False
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='MetricsJournal', daemon=True)
+        self._thread.start()
+    
+    def _archive(self) -> Path:
+        """Rename an existing journal to ``<directory>.<timestamp>`` so a new run cannot truncate it"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        target = self.directory.with_name(f"{self.directory.name}.{timestamp}")
+        suffix = 1
+        while target.exists():
+            target = self.directory.with_name(f"{self.directory.name}.{timestamp}_{suffix}")
+            suffix += 1
+        self.directory.rename(target)
+        logger.warning(
+            f"Existing metrics journal moved to {target}; "
+            f"use TrainingTracker.resume to continue a run instead of starting over"
+        )
+        return target
+    
+    @staticmethod
+    def _column_path(directory: Path, name: str) -> Path:
+        return Path(directory) / f'{name}.bin'
+    
+    @staticmethod
+    def _empty_index() -> Dict[str, Any]:
+        return {
+            'rows': 0,
+            'steps_sorted': True,
+            'epochs_sorted': True,
+            'last_step': None,
+            'last_epoch': None
+        }
+    
+    def _repair(self) -> int:
+        """Truncate torn trailing records left by a crash and return the row count"""
+        rows = self.count_rows(self.directory)
+        for name, dtype in self.COLUMN_DTYPES.items():
+            with open(self._column_path(self.directory, name), 'r+b') as f:
+                f.truncate(rows * dtype.itemsize)
+        
+        # Drop extras that point past the last complete row
+        extras = self._read_extras(self.directory, rows)
+        with open(self.extra_path, 'r+b') as f:
+            f.truncate(len(extras) * self.EXTRA_DTYPE.itemsize)
+        
+        with open(self.keys_path, 'rb') as f:
+            data = f.read()
+        if data and not data.endswith(b'\n'):
+            with open(self.keys_path, 'r+b') as f:
+                f.truncate(data.rfind(b'\n') + 1)
+        return rows
+    
+    def append(self, metrics: TrainingMetrics):
+        """Queue a single step for writing"""
+        if self._closed:
+            raise RuntimeError("MetricsJournal is closed")
+        self._queue.put(metrics)
+    
+    def append_columns(self, columns: Dict[str, np.ndarray]):
+        """Queue a block of normalized columns (see MetricsStorage.add_metrics_batch)"""
+        if self._closed:
+            raise RuntimeError("MetricsJournal is closed")
+        self._queue.put(columns)
+    
+    def _run(self):
+        """Worker loop: write queued entries, fsyncing periodically"""
+        last_sync = time.monotonic()
+        while True:
+            try:
+                items = [self._queue.get(timeout=self.fsync_interval)]
+            except queue.Empty:
+                items = []
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = any(item is self._SENTINEL for item in items)
+            try:
+                self._write_items([item for item in items if item is not self._SENTINEL])
+                if stop or time.monotonic() - last_sync >= self.fsync_interval:
+                    self._sync()
+                    last_sync = time.monotonic()
+            except Exception:
+                logger.exception(f"Failed to write metrics journal {self.directory}")
+            if stop:
+                return
+    
+    def _write_items(self, items: List[Any]):
+        """Write queued TrainingMetrics objects and column blocks in order"""
+        pending: List[TrainingMetrics] = []
+        for item in items:
+            if isinstance(item, TrainingMetrics):
+                pending.append(item)
+                continue
+            if pending:
+                self._write_columns(*MetricsStorage.metrics_to_columns(pending))
+                pending = []
+            core = {name: item[name] for name in self.COLUMN_DTYPES}
+            additional = {key: values for key, values in item.items() if key not in core}
+            self._write_columns(core, additional)
+        if pending:
+            self._write_columns(*MetricsStorage.metrics_to_columns(pending))
+    
+    def _write_columns(self, data: Dict[str, np.ndarray], additional: Dict[str, np.ndarray]):
+        """Append a block of rows to the journal files"""
+        n = len(data['step'])
+        if n == 0:
+            return
+        
+        extra_blocks = []
+        for key, values in additional.items():
+            present = np.flatnonzero(~np.isnan(values))
+            if not len(present):
+                continue
+            if key not in self._key_ids:
+                self._key_ids[key] = len(self.keys)
+                self.keys.append(key)
+                self._keys_file.write(json.dumps(key) + '\n')
+            block = np.empty(len(present), dtype=self.EXTRA_DTYPE)
+            block['row'] = self.rows + present
+            block['key'] = self._key_ids[key]
+            block['value'] = values[present]
+            extra_blocks.append(block)
+        
+        # Keys are flushed before the extras that reference them
+        self._keys_file.flush()
+        if extra_blocks:
+            extras = np.concatenate(extra_blocks)
+            extras = extras[np.argsort(extras['row'], kind='stable')]
+            self._extra_file.write(extras.tobytes())
+            self._extra_file.flush()
+        for name, dtype in self.COLUMN_DTYPES.items():
+            f = self._column_files[name]
+            f.write(np.ascontiguousarray(data[name], dtype=dtype).tobytes())
+            f.flush()
+        
+        self._update_index(data['step'], data['epoch'])
+        self.rows += n
+    
+    def _update_index(self, steps: np.ndarray, epochs: np.ndarray):
+        """Track whether step and epoch remain non-decreasing"""
+        index = self._index
+        for name, values in (('step', steps), ('epoch', epochs)):
+            key = f'{name}s_sorted'
+            last = index[f'last_{name}']
+            if index[key]:
+                index[key] = bool(
+                    (last is None or values[0] >= last) and np.all(np.diff(values) >= 0)
+                )
+            index[f'last_{name}'] = int(values[-1])
+        index['rows'] = self.rows + len(steps)
+    
+    def _write_index(self):
+        index_path = self.directory / 'index.json'
+        tmp_path = index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, index_path)
+    
+    def _sync(self):
+        files = [self._keys_file, self._extra_file, *self._column_files.values()]
+        for f in files:
+            f.flush()
+            os.fsync(f.fileno())
+        self._write_index()
+    
+    def close(self):
+        """Write all queued entries, fsync and close the journal files"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._SENTINEL)
+        self._thread.join()
+        for f in (self._keys_file, self._extra_file, *self._column_files.values()):
+            f.close()
+    
+    @classmethod
+    def _check_format(cls, directory: Path):
+        meta_path = Path(directory) / 'journal.json'
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"{directory} is not a metrics journal: {e}")
+        if meta.get('format') != cls.FORMAT or meta.get('version') != cls.VERSION:
+            raise ValueError(f"Unsupported metrics journal format in {directory}: {meta.get('version')}")
+    
+    @classmethod
+    def count_rows(cls, directory: Union[str, Path]) -> int:
+        """Number of rows for which every core column is complete"""
+        cls._check_format(directory)
+        return min(
+            cls._column_path(directory, name).stat().st_size // dtype.itemsize
+            for name, dtype in cls.COLUMN_DTYPES.items()
+        )
+    
+    @classmethod
+    def read_column(cls, directory: Union[str, Path], name: str, rows: Optional[int] = None) -> np.ndarray:
+        """Memory-map the first ``rows`` values of a core column"""
+        if rows is None:
+            rows = cls.count_rows(directory)
+        dtype = cls.COLUMN_DTYPES[name]
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(cls._column_path(directory, name), dtype=dtype, mode='r', shape=(rows,))
+    
+    @classmethod
+    def _read_extras(cls, directory: Union[str, Path], rows: int) -> np.ndarray:
+        """Memory-map the complete extra records that refer to the first ``rows`` rows"""
+        extra_path = Path(directory) / 'extra.bin'
+        count = extra_path.stat().st_size // cls.EXTRA_DTYPE.itemsize if extra_path.exists() else 0
+        if count == 0:
+            return np.empty(0, dtype=cls.EXTRA_DTYPE)
+        extras = np.memmap(extra_path, dtype=cls.EXTRA_DTYPE, mode='r', shape=(count,))
+        return extras[:np.searchsorted(extras['row'], rows)]
+    
+    @classmethod
+    def read_extras(cls, directory: Union[str, Path], rows: Optional[int] = None) -> np.ndarray:
+        """Memory-map the extra records that belong to complete rows"""
+        if rows is None:
+            rows = cls.count_rows(directory)
+        return cls._read_extras(directory, rows)
+    
+    @staticmethod
+    def read_keys(directory: Union[str, Path]) -> List[str]:
+        """Read the additional metric names; list index is the key id"""
+        keys_path = Path(directory) / 'keys.txt'
+        if not keys_path.exists():
+            return []
+        with open(keys_path) as f:
+            return [json.loads(line) for line in f if line.endswith('\n')]
+    
+    @classmethod
+    def read_index(cls, directory: Union[str, Path], rows: Optional[int] = None) -> Dict[str, Any]:
+        """Read the sortedness index, verifying rows written after the last fsync"""
+        if rows is None:
+            rows = cls.count_rows(directory)
+        index = cls._empty_index()
+        index_path = Path(directory) / 'index.json'
+        if index_path.exists():
+            with open(index_path) as f:
+                saved = json.load(f)
+            if saved.get('rows', 0) <= rows:
+                index.update(saved)
+        
+        # Only the tail beyond the saved index needs to be checked
+        start = min(index['rows'], rows)
+        if start < rows:
+            for name in ('step', 'epoch'):
+                tail = np.asarray(cls.read_column(directory, name, rows)[start:])
+                last = index[f'last_{name}']
+                key = f'{name}s_sorted'
+                if index[key]:
+                    index[key] = bool(
+                        (last is None or tail[0] >= last) and np.all(np.diff(tail) >= 0)
+                    )
+                index[f'last_{name}'] = int(tail[-1])
+        index['rows'] = rows
+        return index
+    
+    @classmethod
+    def iter_columns(cls, directory: Union[str, Path], chunk_size: int = 1_000_000):
+        """Yield the journal as blocks of normalized column arrays"""
+        rows = cls.count_rows(directory)
+        core = {name: cls.read_column(directory, name, rows) for name in cls.COLUMN_DTYPES}
+        extras = cls._read_extras(directory, rows)
+        keys = cls.read_keys(directory)
+        extra_rows = extras['row']
+        
+        for start in range(0, rows, chunk_size):
+            stop = min(start + chunk_size, rows)
+            columns = {name: np.asarray(column[start:stop]) for name, column in core.items()}
+            columns['timestamp'] = columns['timestamp'].view('datetime64[us]')
             
-            return pd.DataFrame(data)
+            lo, hi = np.searchsorted(extra_rows, [start, stop])
+            chunk_extras = extras[lo:hi]
+            for key_id in np.unique(chunk_extras['key']):
+                selected = chunk_extras[chunk_extras['key'] == key_id]
+                values = np.full(stop - start, np.nan)
+                values[selected['row'] - start] = selected['value']
+                columns[keys[key_id]] = values
+            yield columns
+
+class RunReader:
+    """Read-only, memory-mapped access to a run's journaled metrics
+    
+    Opening a run only reads the small metadata files; column data is paged
+    in by the OS as slices are accessed. When the journal index says
+    ``step``/``epoch`` are sorted, ranges are found by binary search and
+    core columns are returned as views of the mapped files. Otherwise the
+    range column is scanned and the selected rows are copied.
+    """
+    
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.rows = MetricsJournal.count_rows(self.directory)
+        self.keys = MetricsJournal.read_keys(self.directory)
+        self.index = MetricsJournal.read_index(self.directory, self.rows)
+        self._key_ids = {key: i for i, key in enumerate(self.keys)}
+        self._mapped: Dict[str, np.ndarray] = {}
+        self._extras: Optional[np.ndarray] = None
+    
+    @classmethod
+    def open(cls, experiment_name: str, log_dir: str = "./logs") -> 'RunReader':
+        """Open the journal written by a tracker with the given experiment name"""
+        return cls(Path(log_dir) / f"{experiment_name}_metrics")
+    
+    def __len__(self) -> int:
+        return self.rows
+    
+    @property
+    def columns(self) -> List[str]:
+        """Names of the core and additional metric columns"""
+        return list(MetricsJournal.COLUMN_DTYPES) + self.keys
+    
+    def _column(self, name: str) -> np.ndarray:
+        column = self._mapped.get(name)
+        if column is None:
+            column = MetricsJournal.read_column(self.directory, name, self.rows)
+            self._mapped[name] = column
+        return column
+    
+    def _range_rows(self, name: str, bounds: tuple) -> Union[slice, np.ndarray]:
+        """Rows whose ``name`` value lies in the half-open range ``[start, stop)``"""
+        start, stop = bounds
+        column = self._column(name)
+        if self.index[f'{name}s_sorted']:
+            first = 0 if start is None else int(np.searchsorted(column, start, 'left'))
+            last = self.rows if stop is None else int(np.searchsorted(column, stop, 'left'))
+            return slice(first, max(first, last))
+        
+        mask = np.ones(self.rows, dtype=bool)
+        if start is not None:
+            mask &= column >= start
+        if stop is not None:
+            mask &= column < stop
+        return np.flatnonzero(mask)
+    
+    def row_selection(self, steps: Optional[tuple] = None, epochs: Optional[tuple] = None) -> Union[slice, np.ndarray]:
+        """Rows matching half-open ``(start, stop)`` step and epoch ranges
+        
+        Either bound may be None. Returns a slice when the selection is
+        contiguous, otherwise an array of row indices.
+        """
+        selection: Union[slice, np.ndarray] = slice(0, self.rows)
+        for name, bounds in (('step', steps), ('epoch', epochs)):
+            if bounds is None:
+                continue
+            rows = self._range_rows(name, bounds)
+            if isinstance(selection, slice) and isinstance(rows, slice):
+                start = max(selection.start, rows.start)
+                selection = slice(start, max(start, min(selection.stop, rows.stop)))
+            else:
+                selection = np.intersect1d(self._as_indices(selection), self._as_indices(rows))
+        return selection
+    
+    @staticmethod
+    def _as_indices(rows: Union[slice, np.ndarray]) -> np.ndarray:
+        return np.arange(rows.start, rows.stop) if isinstance(rows, slice) else rows
+    
+    def _extra_values(self, rows: Union[slice, np.ndarray], keys: List[str]) -> Dict[str, np.ndarray]:
+        """Dense NaN-padded arrays of additional metrics for the selected rows"""
+        if self._extras is None:
+            self._extras = MetricsJournal.read_extras(self.directory, self.rows)
+        extras = self._extras
+        
+        if isinstance(rows, slice):
+            n, first, end = rows.stop - rows.start, rows.start, rows.stop
+        else:
+            n = len(rows)
+            first, end = (int(rows[0]), int(rows[-1]) + 1) if n else (0, 0)
+        lo, hi = np.searchsorted(extras['row'], [first, end])
+        chunk = extras[lo:hi]
+        
+        if isinstance(rows, slice):
+            positions = chunk['row'] - first
+            valid = np.ones(len(chunk), dtype=bool)
+        else:
+            positions = np.minimum(np.searchsorted(rows, chunk['row']), max(n - 1, 0))
+            valid = rows[positions] == chunk['row'] if n else np.zeros(len(chunk), dtype=bool)
+        
+        result = {}
+        for key in keys:
+            values = np.full(n, np.nan)
+            selected = valid & (chunk['key'] == self._key_ids[key])
+            values[positions[selected]] = chunk['value'][selected]
+            result[key] = values
+        return result
+    
+    def select(
+        self,
+        columns: Optional[List[str]] = None,
+        steps: Optional[tuple] = None,
+        epochs: Optional[tuple] = None
+    ) -> Dict[str, np.ndarray]:
+        """Get metric columns for a step/epoch range as NumPy arrays"""
+        names = self.columns if columns is None else list(columns)
+        unknown = [name for name in names if name not in MetricsJournal.COLUMN_DTYPES and name not in self._key_ids]
+        if unknown:
+            raise KeyError(f"Unknown columns: {unknown}")
+        
+        rows = self.row_selection(steps, epochs)
+        result = {}
+        for name in names:
+            if name in MetricsJournal.COLUMN_DTYPES:
+                values = self._column(name)[rows]
+                result[name] = values.view('datetime64[us]') if name == 'timestamp' else values
+        extra_names = [name for name in names if name not in result]
+        if extra_names:
+            result.update(self._extra_values(rows, extra_names))
+        return {name: result[name] for name in names}
+    
+    def to_dataframe(
+        self,
+        columns: Optional[List[str]] = None,
+        steps: Optional[tuple] = None,
+        epochs: Optional[tuple] = None
+    ) -> 'pd.DataFrame':
+        """Get metric columns for a step/epoch range as a DataFrame"""
+        import pandas as pd
+        return pd.DataFrame(self.select(columns, steps, epochs))
+
+class MetricsClient:
+    """Lightweight metrics producer for a worker rank
+    
+    Buffers TrainingMetrics locally and ships them as columnar batches over
+    a local socket to the coordinator's MetricsAggregator, which reduces
+    them across ranks. Only NumPy is needed on the worker side; no log
+    files, checkpoints or sinks are created.
+    """
+    
+    def __init__(self, address: Any, rank: int, authkey: Optional[bytes] = None, flush_every: int = 32):
+        self.rank = rank
+        self.flush_every = max(1, flush_every)
+        self._buffer: List[TrainingMetrics] = []
+        self._conn = Client(address, authkey=authkey)
+        self._conn.send(('hello', rank))
+    
+    def log_metrics(self, metrics: TrainingMetrics):
+        """Queue one step's metrics, sending every ``flush_every`` steps"""
+        self._buffer.append(metrics)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+    
+    def log_metrics_batch(self, metrics: Optional[Dict[str, Any]] = None, **columns):
+        """Send a block of steps given as arrays, like TrainingTracker.log_metrics_batch"""
+        self.flush()
+        data, additional = MetricsStorage._normalize_batch({**(metrics or {}), **columns})
+        self._conn.send(('batch', {**data, **additional}))
+    
+    def flush(self):
+        """Send buffered metrics to the coordinator"""
+        if not self._buffer:
+            return
+        data, additional = MetricsStorage.metrics_to_columns(self._buffer)
+        self._buffer = []
+        self._conn.send(('batch', {**data, **additional}))
+    
+    def close(self):
+        """Flush and tell the coordinator this rank is done"""
+        if self._conn.closed:
+            return
+        self.flush()
+        self._conn.send(('close',))
+        self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class MetricsAggregator:
+    """Coordinator side of multi-process ingestion
+    
+    Accepts MetricsClient connections from ranks ``0..world_size - 1`` and,
+    once every rank that has not finished has reported a step, reduces that step's values across ranks and logs the
+    result through the tracker (storage, journal, console and sinks).
+    ``reductions`` maps metric names to ``'mean'`` (the default), ``'sum'``,
+    ``'min'`` or ``'max'``; NaNs are ignored. Epoch and timestamp take the
+    maximum across ranks. A rank that closes or disconnects stops being
+    waited for, and close() flushes steps that are still incomplete.
+    """
+    
+    REDUCTIONS = {'mean': np.nanmean, 'sum': np.nansum, 'min': np.nanmin, 'max': np.nanmax}
+    
+    def __init__(self, tracker: 'TrainingTracker', world_size: int,
+                 reductions: Optional[Dict[str, str]] = None, address: Any = None):
+        reductions = dict(reductions or {})
+        unknown = {name: op for name, op in reductions.items() if op not in self.REDUCTIONS}
+        if unknown:
+            raise ValueError(f"Unknown reductions {unknown}, expected one of {tuple(self.REDUCTIONS)}")
+        self.tracker = tracker
+        self.world_size = world_size
+        self.reductions = reductions
+        self.authkey = os.urandom(16)
+        self._listener = Listener(address, authkey=self.authkey)
+        self.address = self._listener.address
+        
+        self.lock = threading.Lock()
+        self._pending: Dict[int, Dict[int, Dict[str, float]]] = {}
+        self._ranks = set(range(world_size))
+        self._finished: set = set()
+        self._closed = False
+        self._readers: List[threading.Thread] = []
+        self._connections: List[Any] = []
+        self._accept_thread = threading.Thread(target=self._accept, name='MetricsAggregator', daemon=True)
+        self._accept_thread.start()
+    
+    def _accept(self):
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError):
+                if self._closed:
+                    return
+                continue
+            if self._closed:
+                conn.close()
+                return
+            reader = threading.Thread(target=self._read, args=(conn,), name='MetricsAggregatorReader', daemon=True)
+            with self.lock:
+                self._connections.append(conn)
+                self._readers.append(reader)
+            reader.start()
+    
+    def _read(self, conn):
+        rank = None
+        try:
+            while True:
+                message = conn.recv()
+                if message[0] == 'hello':
+                    if message[1] not in self._ranks:
+                        logger.warning(f"Rejecting metrics client with rank {message[1]} "
+                                       f"outside world size {self.world_size}")
+                        break
+                    rank = message[1]
+                elif message[0] == 'batch':
+                    self._add(rank, message[1])
+                elif message[0] == 'close':
+                    break
+        except (EOFError, OSError):
+            if not self._closed:
+                logger.warning(f"Metrics client for rank {rank} disconnected without closing")
+        finally:
+            conn.close()
+        if rank is not None:
+            self._finish(rank)
+    
+    def _add(self, rank: int, columns: Dict[str, np.ndarray]):
+        """Record a rank's rows and log every step that is now complete"""
+        steps = columns['step']
+        names = list(columns)
+        with self.lock:
+            for i in range(len(steps)):
+                self._pending.setdefault(int(steps[i]), {})[rank] = {
+                    name: columns[name][i] for name in names
+                }
+            self._log_ready()
+    
+    def _finish(self, rank):
+        with self.lock:
+            self._finished.add(rank)
+            self._log_ready()
+    
+    def _log_ready(self, flush_all: bool = False):
+        """Reduce and log complete steps, in step order (lock must be held)"""
+        waiting = self._ranks - self._finished
+        ready = sorted(
+            step for step, ranks in self._pending.items()
+            if flush_all or waiting.issubset(ranks)
+        )
+        if not ready:
+            return
+        rows = [self._pending.pop(step) for step in ready]
+        self.tracker.log_metrics_batch(self._reduce(ready, rows))
+    
+    def _reduce(self, steps: List[int], rows: List[Dict[int, Dict[str, float]]]) -> Dict[str, np.ndarray]:
+        names = {name for ranks in rows for values in ranks.values() for name in values}
+        names -= {'step', 'epoch', 'timestamp'}
+        rank_ids = sorted({rank for ranks in rows for rank in ranks})
+        column_of = {rank: i for i, rank in enumerate(rank_ids)}
+        
+        def matrix(name, fill, dtype):
+            values = np.full((len(steps), len(rank_ids)), fill, dtype=dtype)
+            for i, ranks in enumerate(rows):
+                for rank, row in ranks.items():
+                    if name in row:
+                        values[i, column_of[rank]] = row[name]
+            return values
+        
+        result = {
+            'step': np.asarray(steps, dtype=np.int64),
+            'epoch': matrix('epoch', np.iinfo(np.int64).min, np.int64).max(axis=1),
+            'timestamp': matrix('timestamp', np.iinfo(np.int64).min, np.int64).max(axis=1).view('datetime64[us]'),
+        }
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            for name in names:
+                values = matrix(name, np.nan, np.float64)
+                reduced = self.REDUCTIONS[self.reductions.get(name, 'mean')](values, axis=1)
+                # nansum of an all-NaN row is 0; keep it missing instead
+                reduced[np.isnan(values).all(axis=1)] = np.nan
+                result[name] = reduced
+        return result
+    
+    def close(self, timeout: Optional[float] = 30.0):
+        """Stop accepting ranks, wait for connected ranks to finish and flush"""
+        if self._closed:
+            return
+        self._closed = True
+        # Wake the accept loop with a throwaway connection
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (OSError, EOFError):
+            pass
+        self._accept_thread.join(timeout)
+        self._listener.close()
+        
+        with self.lock:
+            readers = list(self._readers)
+        for reader in readers:
+            reader.join(timeout)
+        with self.lock:
+            for conn in self._connections:
+                conn.close()
+            self._log_ready(flush_all=True)
 
 class BaseCallback(ABC):
-    """Base class for training callbacks"""
+    """Base class for training callbacks
+    
+    Subclasses implement ``on_epoch_end`` and ``on_training_end`` and may
+    override the step-level events ``on_step_end``, ``on_batch_logged`` and
+    ``on_validation_end``; only overridden events are dispatched. Step-level
+    events fire every logged step unless ``every_n_steps`` (when a multiple
+    of N is logged) and/or ``every_t_seconds`` is set.
+    """
+    
+    every_n_steps: Optional[int] = None
+    every_t_seconds: Optional[float] = None
     
     @abstractmethod
     def on_epoch_end(self, epoch: int, metrics: TrainingMetrics):
         """Called at the end of each epoch"""
         pass
     
-    @abstractmethod
-    def on_training_end(self, final_metrics: TrainingMetrics):
-        """Called when training ends"""
-        pass
+    @abstractmethod
+    def on_training_end(self, final_metrics: TrainingMetrics):
+        """Called when training ends"""
+        pass
+    
+    def on_step_end(self, step: int, metrics: TrainingMetrics):
+        """Called after a step is logged, subject to the callback's frequency"""
+        pass
+    
+    def on_batch_logged(self, metrics: TrainingMetrics):
+        """Called with the aggregated entry of a ``log_metrics_batch`` block"""
+        pass
+    
+    def on_validation_end(self, epoch: int, metrics: TrainingMetrics):
+        """Called after validation metrics are logged"""
+        pass
+    
+    def set_tracker(self, tracker: 'TrainingTracker'):
+        """Called by TrainingTracker.add_callback with the owning tracker"""
+        self.tracker = tracker
+    
+    def _get_monitored_best(self, monitor: str, mode: str) -> Optional[Dict[str, Any]]:
+        """Best value of ``monitor`` from the tracker's storage, if it tracks it with ``mode``"""
+        tracker = getattr(self, 'tracker', None)
+        if tracker is None:
+            return None
+        storage_monitor = tracker.metrics_storage.get_monitor(monitor)
+        if storage_monitor is None or storage_monitor.mode != mode:
+            return None
+        return tracker.metrics_storage.get_best(monitor)
+    
+    @staticmethod
+    def _metric_value(metrics: TrainingMetrics, name: str) -> Optional[float]:
+        """Value of a TrainingMetrics field or additional metric, if present"""
+        value = getattr(metrics, name, None)
+        if value is None:
+            value = (metrics.additional_metrics or {}).get(name)
+        return value
+
+class _Hook:
+    """A callable registered for one dispatcher event"""
+    
+    __slots__ = ('fn', 'every_n_steps', 'every_t_seconds', 'next_time', 'order')
+    
+    def __init__(self, fn: Callable, every_n_steps: Optional[int], every_t_seconds: Optional[float], order: int):
+        self.fn = fn
+        self.every_n_steps = every_n_steps
+        self.every_t_seconds = every_t_seconds
+        self.next_time = time.monotonic() + every_t_seconds if every_t_seconds else float('inf')
+        self.order = order
+
+class CallbackDispatcher:
+    """Routes tracker events to callbacks and registered hooks
+    
+    Hooks are grouped per event when registered, so dispatch never scans
+    callbacks that do not handle the event. For the step events, hooks with
+    ``every_n_steps`` sit in a heap keyed by the next step they are due and
+    time-based hooks share one earliest deadline: a step that no hook is due
+    on costs a comparison (plus a clock read when time-based hooks exist).
+    When steps go back (numbered per epoch), the step heap is rebuilt from
+    the new step.
+    """
+    
+    EVENTS = ('step_end', 'batch_logged', 'validation_end', 'epoch_end', 'training_end')
+    STEP_EVENTS = ('step_end', 'batch_logged')
+    
+    def __init__(self):
+        self._every: Dict[str, List[_Hook]] = {event: [] for event in self.EVENTS}
+        self._by_step: Dict[str, list] = {event: [] for event in self.STEP_EVENTS}
+        self._by_time: Dict[str, List[_Hook]] = {event: [] for event in self.STEP_EVENTS}
+        self._next_time: Dict[str, float] = {event: float('inf') for event in self.STEP_EVENTS}
+        self._last_step: Dict[str, Optional[int]] = {event: None for event in self.STEP_EVENTS}
+        self._order = 0
+    
+    def register(self, event: str, fn: Callable, every_n_steps: Optional[int] = None,
+                 every_t_seconds: Optional[float] = None) -> _Hook:
+        """Call ``fn`` on ``event``, optionally only every N steps and/or T seconds"""
+        if event not in self.EVENTS:
+            raise ValueError(f"Unknown callback event {event!r}, expected one of {self.EVENTS}")
+        if (every_n_steps or every_t_seconds) and event not in self.STEP_EVENTS:
+            raise ValueError(f"Frequencies only apply to the step events {self.STEP_EVENTS}")
+        if every_n_steps is not None and every_n_steps < 1:
+            raise ValueError("every_n_steps must be at least 1")
+        
+        hook = _Hook(fn, every_n_steps, every_t_seconds, self._order)
+        self._order += 1
+        if not (every_n_steps or every_t_seconds):
+            self._every[event].append(hook)
+            return hook
+        if every_n_steps:
+            heapq.heappush(self._by_step[event], (0, hook.order, hook))
+        if every_t_seconds:
+            self._by_time[event].append(hook)
+            self._next_time[event] = min(self._next_time[event], hook.next_time)
+        return hook
+    
+    def add_callback(self, callback: BaseCallback):
+        """Register the events a callback implements, with its frequency"""
+        for event in self.EVENTS:
+            name = f'on_{event}'
+            if event in ('epoch_end', 'training_end') or getattr(type(callback), name) is not getattr(BaseCallback, name):
+                frequency = (callback.every_n_steps, callback.every_t_seconds) if event in self.STEP_EVENTS else (None, None)
+                self.register(event, getattr(callback, name), *frequency)
+    
+    def dispatch(self, event: str, *args):
+        """Call every hook of a non-step event"""
+        for hook in self._every[event]:
+            hook.fn(*args)
+    
+    def dispatch_steps(self, event: str, first_step: int, last_step: int, *args):
+        """Call the hooks of a step event due for steps ``first_step..last_step``"""
+        every = self._every[event]
+        heap = self._by_step[event]
+        timed = self._by_time[event]
+        previous = self._last_step[event]
+        self._last_step[event] = last_step
+        if heap and previous is not None and first_step < previous:
+            # Steps restarted: each hook is next due at its first multiple from here
+            heap[:] = [(-(-first_step // hook.every_n_steps) * hook.every_n_steps, order, hook)
+                       for _, order, hook in heap]
+            heapq.heapify(heap)
+        step_due = bool(heap) and heap[0][0] <= last_step
+        now = time.monotonic() if timed else 0.0
+        time_due = bool(timed) and now >= self._next_time[event]
+        if not (every or step_due or time_due):
+            return
+        
+        due = list(every)
+        if step_due:
+            while heap and heap[0][0] <= last_step:
+                _, order, hook = heapq.heappop(heap)
+                n = hook.every_n_steps
+                # Fire only if a multiple of N was logged, not just because steps passed it
+                if (last_step // n) * n >= first_step:
+                    due.append(hook)
+                heapq.heappush(heap, ((last_step // n + 1) * n, order, hook))
+        if time_due:
+            for hook in timed:
+                if now >= hook.next_time:
+                    due.append(hook)
+                    hook.next_time = now + hook.every_t_seconds
+            self._next_time[event] = min(hook.next_time for hook in timed)
+        
+        if len(due) > len(every):
+            # A hook due by both step and time fires once, in registration order
+            due = sorted({hook.order: hook for hook in due}.values(), key=lambda hook: hook.order)
+        for hook in due:
+            hook.fn(*args)
 
 class EarlyStoppingCallback(BaseCallback):
     """Early stopping callback"""
@@ -165,11 +2639,16 @@ class EarlyStoppingCallback(BaseCallback):
         self.should_stop = False
     
     def on_epoch_end(self, epoch: int, metrics: TrainingMetrics):
-        current_value = getattr(metrics, self.monitor, None)
+        current_value = self._metric_value(metrics, self.monitor)
         if current_value is None:
             return
         
-        if self.mode == 'min':
+        best = self._get_monitored_best(self.monitor, self.mode)
+        if best is not None:
+            # The tracker's monitor also sees steps logged during the epoch
+            improved = best['value'] != self.best_value
+            current_value = best['value']
+        elif self.mode == 'min':
             improved = current_value < self.best_value
         else:
             improved = current_value > self.best_value
@@ -186,65 +2665,658 @@ class EarlyStoppingCallback(BaseCallback):
     def on_training_end(self, final_metrics: TrainingMetrics):
         pass
 
+def snapshot_state_to_cpu(state: Any) -> Any:
+    """Copy a (nested) state dict so every tensor and array lives in host memory
+    
+    CPU tensors and NumPy arrays are cloned, so later in-place updates by the
+    optimizer do not leak into the snapshot. CUDA tensors are copied into
+    pinned host memory asynchronously with a single synchronize at the end,
+    so the caller only waits for the device-to-host transfer.
+    """
+    torch = sys.modules.get('torch')
+    cuda_copies = []
+    
+    def copy(value):
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        if torch is not None and isinstance(value, torch.Tensor):
+            value = value.detach()
+            if value.device.type == 'cpu':
+                return value.clone()
+            if value.device.type == 'cuda':
+                host = torch.empty(value.shape, dtype=value.dtype, device='cpu', pin_memory=True)
+                host.copy_(value, non_blocking=True)
+                cuda_copies.append(host)
+                return host
+            return value.to('cpu')
+        if isinstance(value, dict):
+            return type(value)((key, copy(item)) for key, item in value.items())
+        if type(value) in (list, tuple):
+            return type(value)(copy(item) for item in value)
+        return value
+    
+    snapshot = copy(state)
+    if cuda_copies:
+        torch.cuda.synchronize()
+    return snapshot
+
+def _serialize_checkpoint(payload: Dict[str, Any], f):
+    """Write a checkpoint with torch.save when PyTorch is in use, pickle otherwise"""
+    torch = sys.modules.get('torch')
+    if torch is not None:
+        torch.save(payload, f)
+    else:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_checkpoint(path: Union[str, Path], map_location: Any = 'cpu') -> Dict[str, Any]:
+    """Load a checkpoint written by ModelCheckpointCallback
+    
+    Accepts ``.pth`` files and incremental ``.manifest.json`` checkpoints.
+    Returns the checkpoint dict: ``epoch``, ``metrics``, ``timestamp``,
+    ``state`` (registered name -> state dict) and ``monitor`` when set.
+    """
+    path = Path(path)
+    if ChunkStore.is_manifest(path):
+        return ChunkStore(path.parent).load(path, map_location)
+    if zipfile.is_zipfile(path):
+        try:
+            import torch
+        except ImportError:
+            raise ImportError("PyTorch not available. Please install PyTorch to load this checkpoint.")
+        try:
+            return torch.load(path, map_location=map_location, weights_only=False)
+        except TypeError:
+            return torch.load(path, map_location=map_location)
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+class _ChunkRef:
+    """Placeholder for an array or tensor stored as chunks in a ChunkStore"""
+    
+    __slots__ = ('kind', 'dtype', 'shape', 'nbytes', 'chunks')
+    
+    def __init__(self, kind: str, dtype: Any, shape: tuple, nbytes: int, chunks: List[str]):
+        self.kind = kind
+        self.dtype = dtype
+        self.shape = shape
+        self.nbytes = nbytes
+        self.chunks = chunks
+
+class ChunkStore:
+    """Content-addressed chunk storage for incremental checkpoints
+    
+    Arrays and tensors of at least ``inline_threshold`` bytes are split into
+    ``chunk_size`` pieces named by their BLAKE2b digest under
+    ``<directory>/chunks``. A chunk is written only if no checkpoint has
+    stored it yet, so unchanged parameters (frozen embeddings, buffers) cost
+    nothing after the first save. Everything else is pickled into a small
+    skeleton, itself stored as a chunk, and each checkpoint is a JSON
+    manifest listing the chunks it references. ``collect_garbage`` removes
+    chunks no manifest in the directory references.
+    """
+    
+    MANIFEST_SUFFIX = '.manifest.json'
+    FORMAT = 'ml-tracker-chunked-checkpoint'
+    
+    def __init__(self, directory: Union[str, Path], chunk_size: int = 4 << 20, inline_threshold: int = 64 << 10):
+        self.directory = Path(directory)
+        self.chunk_dir = self.directory / 'chunks'
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.inline_threshold = inline_threshold
+        self._known = {path.name for path in self.chunk_dir.glob('*/*') if not path.name.endswith('.tmp')}
+    
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunk_dir / digest[:2] / digest
+    
+    def _put(self, data: memoryview, stats: Dict[str, int]) -> str:
+        """Store one chunk unless it already exists; returns its digest"""
+        digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+        stats['bytes_total'] += len(data)
+        if digest not in self._known:
+            path = self._chunk_path(digest)
+            path.parent.mkdir(exist_ok=True)
+            _write_file_atomic(path, lambda f: f.write(data))
+            self._known.add(digest)
+            stats['bytes_written'] += len(data)
+        return digest
+    
+    def _put_buffer(self, buffer: np.ndarray, stats: Dict[str, int]) -> List[str]:
+        view = memoryview(buffer).cast('B')
+        return [self._put(view[i:i + self.chunk_size], stats) for i in range(0, len(view), self.chunk_size)]
+    
+    def _split(self, value: Any, stats: Dict[str, int]) -> Any:
+        """Replace large arrays and tensors with chunk references"""
+        torch = sys.modules.get('torch')
+        if isinstance(value, np.ndarray) and value.dtype != object and value.nbytes >= self.inline_threshold:
+            raw = np.ascontiguousarray(value).reshape(-1).view(np.uint8)
+            return _ChunkRef('numpy', value.dtype, value.shape, raw.nbytes, self._put_buffer(raw, stats))
+        if torch is not None and isinstance(value, torch.Tensor):
+            tensor = value.detach().cpu().contiguous()
+            nbytes = tensor.numel() * tensor.element_size()
+            if nbytes >= self.inline_threshold:
+                raw = tensor.reshape(-1).view(torch.uint8).numpy()
+                return _ChunkRef('torch', tensor.dtype, tuple(tensor.shape), nbytes, self._put_buffer(raw, stats))
+            return value
+        if isinstance(value, dict):
+            return type(value)((key, self._split(item, stats)) for key, item in value.items())
+        if type(value) in (list, tuple):
+            return type(value)(self._split(item, stats) for item in value)
+        return value
+    
+    def _join(self, value: Any, map_location: Any) -> Any:
+        """Rebuild arrays and tensors from chunk references"""
+        if isinstance(value, _ChunkRef):
+            raw = np.empty(value.nbytes, dtype=np.uint8)
+            offset = 0
+            for digest in value.chunks:
+                data = self._chunk_path(digest).read_bytes()
+                raw[offset:offset + len(data)] = np.frombuffer(data, dtype=np.uint8)
+                offset += len(data)
+            if value.kind == 'numpy':
+                return raw.view(value.dtype).reshape(value.shape)
+            import torch
+            tensor = torch.from_numpy(raw).view(value.dtype).reshape(value.shape)
+            return tensor if map_location in (None, 'cpu') else tensor.to(map_location)
+        if isinstance(value, dict):
+            return type(value)((key, self._join(item, map_location)) for key, item in value.items())
+        if type(value) in (list, tuple):
+            return type(value)(self._join(item, map_location) for item in value)
+        return value
+    
+    def save(self, path: Union[str, Path], payload: Dict[str, Any]) -> Dict[str, int]:
+        """Write a checkpoint manifest, storing only chunks not already present
+        
+        Returns ``bytes_total`` (size of the checkpoint's chunks) and
+        ``bytes_written`` (bytes of new chunks actually written).
+        """
+        stats = {'bytes_total': 0, 'bytes_written': 0}
+        skeleton = pickle.dumps(self._split(payload, stats), protocol=pickle.HIGHEST_PROTOCOL)
+        skeleton_digest = self._put(memoryview(skeleton), stats)
+        
+        chunks = set()
+        self._collect_refs(pickle.loads(skeleton), chunks)
+        chunks.add(skeleton_digest)
+        manifest = {
+            'format': self.FORMAT,
+            'version': 1,
+            'skeleton': skeleton_digest,
+            'chunks': sorted(chunks),
+            **stats,
+        }
+        _write_file_atomic(Path(path), lambda f: f.write(json.dumps(manifest, indent=2).encode()))
+        return stats
+    
+    @classmethod
+    def _collect_refs(cls, value: Any, chunks: set):
+        if isinstance(value, _ChunkRef):
+            chunks.update(value.chunks)
+        elif isinstance(value, dict):
+            for item in value.values():
+                cls._collect_refs(item, chunks)
+        elif type(value) in (list, tuple):
+            for item in value:
+                cls._collect_refs(item, chunks)
+    
+    def load(self, path: Union[str, Path], map_location: Any = 'cpu') -> Dict[str, Any]:
+        """Load a checkpoint from its manifest"""
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get('format') != self.FORMAT:
+            raise ValueError(f"{path} is not a chunked checkpoint manifest")
+        skeleton = pickle.loads(self._chunk_path(manifest['skeleton']).read_bytes())
+        return self._join(skeleton, map_location)
+    
+    @classmethod
+    def is_manifest(cls, path: Union[str, Path]) -> bool:
+        return str(path).endswith(cls.MANIFEST_SUFFIX)
+    
+    def referenced_chunks(self) -> set:
+        """Digests referenced by any manifest in the directory"""
+        referenced = set()
+        for manifest_path in self.directory.glob(f'*{self.MANIFEST_SUFFIX}'):
+            try:
+                with open(manifest_path) as f:
+                    referenced.update(json.load(f)['chunks'])
+            except (OSError, ValueError, KeyError):
+                logger.warning(f"Skipping unreadable checkpoint manifest {manifest_path}")
+                # Keep every chunk rather than risk deleting live data
+                return set(self._known)
+        return referenced
+    
+    def collect_garbage(self) -> Dict[str, int]:
+        """Delete chunks that no manifest references; returns counts freed"""
+        referenced = self.referenced_chunks()
+        freed = {'chunks': 0, 'bytes': 0}
+        for path in self.chunk_dir.glob('*/*'):
+            if path.name in referenced:
+                continue
+            freed['bytes'] += path.stat().st_size
+            freed['chunks'] += 1
+            path.unlink()
+            self._known.discard(path.name)
+        return freed
+
+def _write_file_atomic(path: Path, write: Callable):
+    """Write a file through a fsynced temporary file and an atomic rename"""
+    temp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+class CheckpointIndex:
+    """Retention index keeping the best ``keep_best`` checkpoints plus the latest ``keep_latest``
+    
+    The best set is a heap keyed on the monitored value whose root is the
+    worst checkpoint still retained, so checking whether a value qualifies is
+    O(1) and inserting or evicting is O(log k). A checkpoint is deleted only
+    once it has left both sets. The index is persisted as JSON next to the
+    checkpoints and reloaded on restart, so the retained set is recovered
+    without scanning the directory or reading checkpoint metrics. With a
+    ``name`` the file is ``<name>.checkpoint_index.json``, so experiments
+    sharing a checkpoint directory never rotate each other's checkpoints.
+    """
+    
+    FILENAME = 'checkpoint_index.json'
+    
+    def __init__(self, directory: Union[str, Path], keep_latest: int, keep_best: int = 0,
+                 monitor: Optional[str] = None, mode: str = 'min', name: Optional[str] = None):
+        if mode not in ('min', 'max'):
+            raise ValueError(f"Unknown mode {mode!r}, expected 'min' or 'max'")
+        self.directory = Path(directory)
+        self.path = self.directory / (f"{name}.{self.FILENAME}" if name else self.FILENAME)
+        self.keep_latest = keep_latest
+        self.keep_best = keep_best
+        self.monitor = monitor
+        self.mode = mode
+        self._seq = 0
+        self._best: List[list] = []  # heap of [priority, seq, name, value]
+        self._latest: deque = deque()  # (seq, name), oldest first
+        if self.path.exists():
+            self._load()
+    
+    def _priority(self, value: float) -> float:
+        return -value if self.mode == 'min' else value
+    
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint index {self.path}: {e}")
+            return
+        self._seq = state.get('seq', 0)
+        exists = lambda name: (self.directory / name).exists()
+        self._latest = deque((seq, name) for seq, name in state.get('latest', []) if exists(name))
+        if (state.get('monitor'), state.get('mode')) == (self.monitor, self.mode):
+            self._best = [entry for entry in state.get('best', []) if exists(entry[2])]
+            heapq.heapify(self._best)
+        elif state.get('best'):
+            logger.warning(
+                f"Checkpoint index {self.path} ranks {state.get('monitor')!r} ({state.get('mode')}); "
+                f"its best checkpoints are no longer managed"
+            )
+    
+    def save(self):
+        """Atomically persist the index"""
+        state = {
+            'version': 1,
+            'monitor': self.monitor,
+            'mode': self.mode,
+            'seq': self._seq,
+            'best': self._best,
+            'latest': list(self._latest),
+        }
+        _write_file_atomic(self.path, lambda f: f.write(json.dumps(state, indent=2).encode()))
+    
+    def qualifies(self, value: Optional[float]) -> bool:
+        """Whether a checkpoint with ``value`` would enter the best set"""
+        if self.keep_best <= 0 or value is None or np.isnan(value):
+            return False
+        return len(self._best) < self.keep_best or self._priority(value) > self._best[0][0]
+    
+    def add(self, path: Union[str, Path], value: Optional[float] = None) -> List[Path]:
+        """Record a new checkpoint; returns the checkpoints that are no longer retained"""
+        name = Path(path).name
+        self._seq += 1
+        candidates = []
+        
+        self._latest.append((self._seq, name))
+        while len(self._latest) > self.keep_latest:
+            candidates.append(self._latest.popleft()[1])
+        
+        if self.qualifies(value):
+            entry = [self._priority(value), self._seq, name, float(value)]
+            if len(self._best) < self.keep_best:
+                heapq.heappush(self._best, entry)
+            else:
+                candidates.append(heapq.heappushpop(self._best, entry)[2])
+        
+        retained = self._retained_names()
+        return [self.directory / name for name in dict.fromkeys(candidates) if name not in retained]
+    
+    def _retained_names(self) -> set:
+        return {name for _, name in self._latest} | {entry[2] for entry in self._best}
+    
+    def retained(self) -> List[Path]:
+        """Retained checkpoints, oldest first"""
+        entries = dict(self._latest)
+        entries.update((entry[1], entry[2]) for entry in self._best)
+        return [self.directory / entries[seq] for seq in sorted(entries)]
+    
+    @property
+    def best(self) -> Optional[Path]:
+        """Best retained checkpoint by the monitored metric"""
+        if not self._best:
+            return None
+        return self.directory / max(self._best)[2]
+    
+    def best_checkpoints(self) -> List[Dict[str, Any]]:
+        """Best-set checkpoints with their values, best first"""
+        return [
+            {'path': self.directory / name, 'value': value}
+            for _, _, name, value in sorted(self._best, reverse=True)
+        ]
+
 class ModelCheckpointCallback(BaseCallback):
-    """Model checkpoint callback"""
+    """Model checkpoint callback
+    
+    Every ``save_frequency`` epochs the state of each registered object
+    (anything with ``state_dict()``, such as a model or optimizer, or a
+    callable returning a state dict) is snapshotted to host memory on the
+    training thread. Serialization and the disk write happen on a background
+    thread: the checkpoint is written to a temporary file, fsynced and
+    atomically renamed into place, then the oldest checkpoints beyond
+    ``max_checkpoints`` are removed. At most ``max_pending`` snapshots wait
+    to be written before a save blocks.
     
-    def __init__(self, checkpoint_dir: str, save_frequency: int = 100, max_checkpoints: int = 5):
+    With ``incremental=True`` checkpoints go to a ChunkStore in
+    ``checkpoint_dir``: only chunks that changed since earlier checkpoints
+    are written, each checkpoint is a ``.manifest.json`` file, and chunks
+    left unreferenced by rotation are garbage-collected.
+    
+    With ``keep_best=k`` and a ``monitor`` metric, retention is handled by a
+    CheckpointIndex: the ``k`` best checkpoints by ``monitor`` are kept in
+    addition to the latest ``keep_latest`` (``max_checkpoints`` by default),
+    and an epoch that would enter the best set is saved even when it does
+    not fall on ``save_frequency``.
+    
+    ``experiment_name`` prefixes the checkpoint files and names the index,
+    keeping runs that share ``checkpoint_dir`` apart.
+    """
+    
+    def __init__(
+        self,
+        checkpoint_dir: str,
+        save_frequency: int = 100,
+        max_checkpoints: int = 5,
+        monitor: Optional[str] = None,
+        mode: str = 'min',
+        max_pending: int = 2,
+        incremental: bool = False,
+        keep_best: int = 0,
+        keep_latest: Optional[int] = None,
+        experiment_name: Optional[str] = None
+    ):
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         self.save_frequency = save_frequency
         self.max_checkpoints = max_checkpoints
-        self.saved_checkpoints = []
+        self.monitor = monitor
+        self.mode = mode
+        if keep_best > 0 and monitor is None:
+            raise ValueError("keep_best requires a monitor metric")
+        self.index = CheckpointIndex(
+            self.checkpoint_dir,
+            keep_latest if keep_latest is not None else max_checkpoints,
+            keep_best,
+            monitor,
+            mode,
+            experiment_name
+        )
+        self.experiment_name = experiment_name
+        self.saved_checkpoints = self.index.retained()
+        self.state_objects: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._pending = threading.BoundedSemaphore(max(1, max_pending))
+        self._futures: List[Future] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.chunk_store: Optional[ChunkStore] = ChunkStore(self.checkpoint_dir) if incremental else None
+    
+    def register_state(self, name: str, obj: Any):
+        """Save ``obj.state_dict()`` (or ``obj()``) under ``name`` in each checkpoint"""
+        if not hasattr(obj, 'state_dict') and not callable(obj):
+            raise TypeError(f"Checkpoint state {name!r} must have a state_dict() method or be callable")
+        self.state_objects[name] = obj
     
     def on_epoch_end(self, epoch: int, metrics: TrainingMetrics):
-        if epoch % self.save_frequency == 0:
-            self._save_checkpoint(epoch, metrics)
+        value = self._metric_value(metrics, self.monitor) if self.monitor is not None else None
+        with self._lock:
+            qualifies = self.index.qualifies(value)
+        if epoch % self.save_frequency == 0 or qualifies:
+            self._save_checkpoint(epoch, metrics, value)
     
-    def _save_checkpoint(self, epoch: int, metrics: TrainingMetrics):
-        """Save model checkpoint"""
+    @property
+    def best_checkpoint(self) -> Optional[Path]:
+        """Path of the best retained checkpoint by ``monitor``"""
+        with self._lock:
+            return self.index.best
+    
+    def _save_checkpoint(self, epoch: int, metrics: TrainingMetrics, value: Optional[float] = None) -> Future:
+        """Snapshot the registered state and queue the checkpoint write"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        checkpoint_name = f"checkpoint_epoch_{epoch}_{timestamp}.pth"
+        suffix = ChunkStore.MANIFEST_SUFFIX if self.chunk_store is not None else '.pth'
+        checkpoint_name = f"checkpoint_epoch_{epoch}_{timestamp}{suffix}"
+        if self.experiment_name:
+            checkpoint_name = f"{self.experiment_name}_{checkpoint_name}"
         checkpoint_path = self.checkpoint_dir / checkpoint_name
         
-        # Save checkpoint metadata
         checkpoint_data = {
             'epoch': epoch,
             'metrics': asdict(metrics),
             'timestamp': timestamp
         }
+        if self.monitor is not None:
+            best = self._get_monitored_best(self.monitor, self.mode)
+            if best is not None:
+                checkpoint_data['monitor'] = {
+                    'name': self.monitor,
+                    'best': best,
+                    'is_best': best['epoch'] == epoch
+                }
         
-        with open(checkpoint_path, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2, default=str)
+        # Only the device-to-host copy happens on the training thread
+        checkpoint_data['state'] = {
+            name: snapshot_state_to_cpu(obj.state_dict() if hasattr(obj, 'state_dict') else obj())
+            for name, obj in self.state_objects.items()
+        }
         
-        self.saved_checkpoints.append(checkpoint_path)
+        self._pending.acquire()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='checkpoint')
+        future = self._executor.submit(self._write_checkpoint, checkpoint_path, checkpoint_data, value)
+        future.add_done_callback(lambda _: self._pending.release())
+        with self._lock:
+            self._futures = [f for f in self._futures if not f.done()] + [future]
+        return future
+    
+    def _write_checkpoint(self, checkpoint_path: Path, checkpoint_data: Dict[str, Any],
+                          value: Optional[float] = None) -> Path:
+        """Serialize and atomically write a checkpoint, then retire the ones the index drops"""
+        try:
+            if self.chunk_store is not None:
+                stats = self.chunk_store.save(checkpoint_path, checkpoint_data)
+            else:
+                _write_file_atomic(checkpoint_path, lambda f: _serialize_checkpoint(checkpoint_data, f))
+        except Exception as e:
+            logger.error(f"Failed to save checkpoint {checkpoint_path}: {e}")
+            raise
         
-        # Remove old checkpoints
-        if len(self.saved_checkpoints) > self.max_checkpoints:
-            old_checkpoint = self.saved_checkpoints.pop(0)
-            if old_checkpoint.exists():
-                old_checkpoint.unlink()
+        with self._lock:
+            retired = self.index.add(checkpoint_path, value)
+            # Persist the index before deleting so it never lists missing files as retained
+            self.index.save()
+            self.saved_checkpoints = self.index.retained()
+            
+            rotated = False
+            for old_checkpoint in retired:
+                if old_checkpoint.exists():
+                    old_checkpoint.unlink()
+                    rotated = True
         
-        logger.info(f"Checkpoint saved: {checkpoint_path}")
+        if self.chunk_store is not None:
+            if rotated:
+                self.chunk_store.collect_garbage()
+            logger.info(f"Checkpoint saved: {checkpoint_path} "
+                        f"(wrote {stats['bytes_written']:,} of {stats['bytes_total']:,} bytes)")
+        else:
+            logger.info(f"Checkpoint saved: {checkpoint_path}")
+        return checkpoint_path
+    
+    def wait(self):
+        """Block until queued checkpoints are written, re-raising write errors"""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.result()
     
     def on_training_end(self, final_metrics: TrainingMetrics):
-        pass
+        if self._executor is not None:
+            # Failed writes were already logged; finish the rest
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+class TrackerOverhead:
+    """Self-profile of the time callers spend inside a tracker's methods
+    
+    ``wrap`` replaces methods on one tracker instance, so trackers without
+    self-profiling pay nothing. Per-method times are inclusive; the total
+    only counts outermost calls on each thread (``on_epoch_end`` calling
+    ``log_metrics`` is counted once), so it can be compared with wall time.
+    Work on the tracker's background threads is not included since it does
+    not block the training loop.
+    """
+    
+    METHODS = (
+        'start_training', 'log_metrics', 'log_metrics_batch', 'on_epoch_end', 'on_validation_end',
+        'get_training_summary', 'save_training_report', 'end_training'
+    )
+    
+    def __init__(self):
+        self.started = time.perf_counter_ns()
+        self.total_ns = 0
+        self.methods: Dict[str, PhaseStats] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def wrap(self, name: str, method: Callable) -> Callable:
+        stats = self.methods.setdefault(name, PhaseStats())
+        local = self._local
+        
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            depth = getattr(local, 'depth', 0)
+            local.depth = depth + 1
+            start = time.perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                ns = time.perf_counter_ns() - start
+                local.depth = depth
+                with self._lock:
+                    stats.add(ns)
+                    if depth == 0:
+                        self.total_ns += ns
+        return profiled
+    
+    def report(self) -> Dict[str, Any]:
+        """Tracker time as a share of wall time since profiling started, with per-method stats"""
+        wall_ns = time.perf_counter_ns() - self.started
+        with self._lock:
+            return {
+                'wall_seconds': wall_ns / 1e9,
+                'tracker_seconds': self.total_ns / 1e9,
+                'percent_of_wall': 100.0 * self.total_ns / wall_ns if wall_ns else 0.0,
+                'methods': {name: stats.as_dict() for name, stats in self.methods.items() if stats.count},
+            }
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers formatting to the listener thread
+    
+    The stock ``prepare`` formats the message on the calling thread so the
+    record can be pickled. Records here never leave the process, so they are
+    passed through untouched.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 class TrainingTracker:
     """Main training tracker class"""
     
-    def __init__(self, config: TrainingConfig):
+    LOG_POLICIES = ('every_step', 'every_n_steps', 'every_t_seconds', 'on_improvement')
+    
+    def __init__(self, config: TrainingConfig, resume: bool = False):
         self.config = config
-        self.metrics_storage = MetricsStorage(config.metric_history_size)
+        self.metrics_storage = MetricsStorage(
+            config.metric_history_size,
+            sharded=config.sharded_ingestion,
+            shared_name=config.experiment_name if config.shared_memory else None,
+            shared_extra_slots=config.shared_extra_slots
+        )
+        for spec in config.monitored_metrics:
+            self.metrics_storage.monitor(**spec)
         self.callbacks: List[BaseCallback] = []
+        self.dispatcher = CallbackDispatcher()
         self.training_start_time: Optional[datetime] = None
         self.training_end_time: Optional[datetime] = None
         
+        if config.log_policy not in self.LOG_POLICIES:
+            raise ValueError(
+                f"Unknown log policy {config.log_policy!r}, expected one of {self.LOG_POLICIES}"
+            )
+        if config.plot_downsample not in DOWNSAMPLE_METHODS:
+            raise ValueError(
+                f"Unknown downsample method {config.plot_downsample!r}, expected one of {DOWNSAMPLE_METHODS}"
+            )
+        self._log_calls = 0
+        self._last_log_time = float('-inf')
+        self._log_best_loss = float('inf')
+        self._log_best_accuracy = float('-inf')
+        self._report_executor: Optional[ThreadPoolExecutor] = None
+        self.aggregator: Optional[MetricsAggregator] = None
+        self.throughput: Optional[ThroughputMeter] = None
+        if config.track_throughput:
+            self.throughput = ThroughputMeter(
+                config.batch_size, config.num_epochs, config.steps_per_epoch, config.throughput_window
+            )
+        self.profiler = PhaseProfiler(cuda=config.phase_cuda_timing)
+        self.resource_sampler: Optional[ResourceSampler] = None
+        if config.sample_resources:
+            series = self.metrics_storage.add_time_series(
+                'resources', RESOURCE_METRICS, config.resource_history_size
+            )
+            self.resource_sampler = ResourceSampler(series, config.resource_sample_interval)
+            self.resource_sampler.start()
+        
         # Setup directories
         self.log_dir = Path(config.log_dir)
         self.checkpoint_dir = Path(config.checkpoint_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         
+        # Setup the on-disk metrics journal, replaying it when resuming
+        self.journal: Optional[MetricsJournal] = None
+        if config.enable_journal:
+            self._setup_journal(resume)
+        
         # Setup logging
         self._setup_logging()
         
@@ -254,6 +3326,13 @@ class TrainingTracker:
         # Setup external integrations
         self._setup_external_integrations()
         
+        # Wrap the public entry points last so setup is not counted
+        self.self_profile: Optional[TrackerOverhead] = None
+        if config.self_profile:
+            self.self_profile = TrackerOverhead()
+            for name in TrackerOverhead.METHODS:
+                setattr(self, name, self.self_profile.wrap(name, getattr(self, name)))
+        
         logger.info(f"TrainingTracker initialized for experiment: {config.experiment_name}")
     
     def _setup_logging(self):
@@ -263,7 +3342,115 @@ class TrainingTracker:
         file_handler.setLevel(logging.INFO)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        
+        if self.config.async_file_logging:
+            # File writes happen on the listener thread, off the training loop
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            self._log_handler = _InProcessQueueHandler(log_queue)
+            self._log_handler.setLevel(logging.INFO)
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            self._log_listener.start()
+            atexit.register(self._stop_file_logging)
+        else:
+            self._log_handler = file_handler
+        self._file_handler = file_handler
+        logger.addHandler(self._log_handler)
+    
+    def _finish_async_file_logging(self):
+        """Flush queued log records, stop the listener and write to the file directly"""
+        if self._log_listener is None:
+            return
+        logger.removeHandler(self._log_handler)
+        self._log_listener.stop()
+        self._log_listener = None
+        atexit.unregister(self._stop_file_logging)
+        # Messages logged after training (e.g. saved reports) still reach the file
+        self._log_handler = self._file_handler
+        logger.addHandler(self._log_handler)
+    
+    def _stop_file_logging(self):
+        """Flush queued log records, stop the listener and close the log file"""
+        if self._log_handler is None:
+            return
+        logger.removeHandler(self._log_handler)
+        self._log_handler = None
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+            atexit.unregister(self._stop_file_logging)
+        self._file_handler.close()
+    
+    def _should_log(self, metrics: TrainingMetrics) -> bool:
+        """Decide whether a step is written to the console/file log"""
+        policy = self.config.log_policy
+        self._log_calls += 1
+        if policy == 'every_step':
+            return True
+        if policy == 'every_n_steps':
+            return (self._log_calls - 1) % max(1, self.config.log_every_n_steps) == 0
+        if policy == 'every_t_seconds':
+            now = time.monotonic()
+            if now - self._last_log_time >= self.config.log_every_seconds:
+                self._last_log_time = now
+                return True
+            return False
+        
+        # on_improvement
+        improved = False
+        if metrics.loss is not None and metrics.loss < self._log_best_loss:
+            self._log_best_loss = metrics.loss
+            improved = True
+        if metrics.accuracy is not None and metrics.accuracy > self._log_best_accuracy:
+            self._log_best_accuracy = metrics.accuracy
+            improved = True
+        return improved
+    
+    def _setup_journal(self, resume: bool):
+        """Open the metrics journal and rebuild storage from it when resuming"""
+        journal_dir = self.log_dir / f"{self.config.experiment_name}_metrics"
+        self.journal = MetricsJournal(
+            journal_dir,
+            fsync_interval=self.config.journal_fsync_interval,
+            resume=resume
+        )
+        if resume and self.journal.rows:
+            # Nothing has been appended yet, so the files hold exactly the old run
+            for columns in MetricsJournal.iter_columns(journal_dir):
+                self.metrics_storage.add_metrics_batch(columns)
+            logger.info(f"Restored {self.journal.rows} journaled steps from {journal_dir}")
+    
+    @classmethod
+    def resume(cls, experiment_name: str, log_dir: str = "./logs", **overrides) -> 'TrainingTracker':
+        """Recreate the tracker of an interrupted run from its metrics journal
+        
+        The configuration saved by ``start_training`` is reused when present,
+        with ``overrides`` applied on top. Metrics storage and best metrics
+        are rebuilt from the journal, and new metrics are appended to it.
+        """
+        config_kwargs: Dict[str, Any] = {}
+        config_path = Path(log_dir) / f"{experiment_name}_config.json"
+        if config_path.exists():
+            with open(config_path) as f:
+                saved = json.load(f)
+            known = {config_field.name for config_field in fields(TrainingConfig)}
+            config_kwargs = {key: value for key, value in saved.items() if key in known}
+        config_kwargs.update(overrides)
+        config_kwargs.update(experiment_name=experiment_name, log_dir=log_dir, enable_journal=True)
+        return cls(TrainingConfig(**config_kwargs), resume=True)
+    
+    def register_checkpoint_state(self, **objects):
+        """Register objects saved with each checkpoint, e.g. ``model=model, optimizer=optimizer``
+        
+        Each object needs a ``state_dict()`` method or must be a callable
+        returning the state to save.
+        """
+        for callback in self.callbacks:
+            if isinstance(callback, ModelCheckpointCallback):
+                for name, obj in objects.items():
+                    callback.register_state(name, obj)
     
     def _initialize_callbacks(self):
         """Initialize training callbacks"""
@@ -273,7 +3460,12 @@ class TrainingTracker:
         self.add_callback(ModelCheckpointCallback(
             self.config.checkpoint_dir,
             self.config.save_frequency,
-            self.config.max_checkpoints
+            self.config.max_checkpoints,
+            monitor=self.config.checkpoint_monitor,
+            mode=self.config.checkpoint_mode,
+            incremental=self.config.incremental_checkpoints,
+            keep_best=self.config.keep_best_checkpoints,
+            experiment_name=self.config.experiment_name
         ))
     
     def _setup_external_integrations(self):
@@ -306,10 +3498,42 @@ class TrainingTracker:
                 self.wandb_available = False
         else:
             self.wandb_available = False
+        
+        self.sink_writer: Optional[AsyncSinkWriter] = None
+        if self.config.async_sinks and (self.tensorboard_writer or self.wandb_available):
+            self.sink_writer = AsyncSinkWriter(
+                self._write_to_sinks,
+                max_queue_size=self.config.sink_queue_size,
+                backpressure=self.config.sink_backpressure,
+                batch_size=self.config.sink_batch_size,
+                sample_every=self.config.sink_sample_every
+            )
+            logger.info(f"Asynchronous sink writer enabled ({self.config.sink_backpressure})")
     
     def add_callback(self, callback: BaseCallback):
-        """Add a training callback"""
+        """Add a training callback
+        
+        Callbacks with a ``monitor`` attribute get that metric registered
+        with the storage (unless already monitored), so they can query its
+        best value instead of rescanning the history.
+        """
+        callback.set_tracker(self)
+        monitor = getattr(callback, 'monitor', None)
+        if monitor and self.metrics_storage.get_monitor(monitor) is None:
+            self.metrics_storage.monitor(monitor, getattr(callback, 'mode', 'min'))
         self.callbacks.append(callback)
+        self.dispatcher.add_callback(callback)
+    
+    def register_hook(self, event: str, fn: Callable, every_n_steps: Optional[int] = None,
+                      every_t_seconds: Optional[float] = None):
+        """Call ``fn`` on a tracker event without writing a callback class
+        
+        Events and arguments: ``step_end`` (step, metrics), ``batch_logged``
+        (metrics), ``validation_end`` (epoch, metrics), ``epoch_end`` (epoch,
+        metrics) and ``training_end`` (final_metrics). The step events accept
+        ``every_n_steps`` and ``every_t_seconds``.
+        """
+        return self.dispatcher.register(event, fn, every_n_steps, every_t_seconds)
     
     def start_training(self):
         """Mark the start of training"""
@@ -323,57 +3547,182 @@ class TrainingTracker:
     
     def log_metrics(self, metrics: TrainingMetrics):
         """Log training metrics"""
+        if self.throughput is not None:
+            telemetry = self.throughput.update(metrics.step, metrics.epoch)
+            if telemetry:
+                metrics = replace(metrics, additional_metrics={**metrics.additional_metrics, **telemetry})
         self.metrics_storage.add_metric(metrics)
+        if self.journal is not None:
+            self.journal.append(metrics)
+        
+        # Log to console/file; arguments are only formatted by the handlers
+        if self._should_log(metrics) and logger.isEnabledFor(logging.INFO):
+            logger.info("Epoch %s, Step %s: loss=%.4f, accuracy=%s",
+                        metrics.epoch, metrics.step, metrics.loss,
+                        "N/A" if metrics.accuracy is None else f"{metrics.accuracy:.4f}")
+        
+        # Log to TensorBoard and W&B
+        self._emit_to_sinks(metrics)
+        
+        self.dispatcher.dispatch_steps('step_end', metrics.step, metrics.step, metrics.step, metrics)
+    
+    def aggregate_workers(self, world_size: int, reductions: Optional[Dict[str, str]] = None,
+                          address: Any = None) -> MetricsAggregator:
+        """Make this tracker the coordinator for ``world_size`` worker ranks
+        
+        Workers connect with ``MetricsClient(aggregator.address, rank,
+        authkey=aggregator.authkey)``; their per-step metrics are reduced
+        across ranks (see MetricsAggregator) before storage and sinks.
+        """
+        if self.aggregator is not None:
+            raise RuntimeError("This tracker is already aggregating worker metrics")
+        self.aggregator = MetricsAggregator(self, world_size, reductions, address)
+        return self.aggregator
+    
+    def log_metrics_batch(self, metrics: Optional[Dict[str, Any]] = None, **columns) -> TrainingMetrics:
+        """Log metrics for a block of steps at once
+        
+        Takes a dict of arrays and/or keyword arrays (``epoch``, ``step``,
+        ``loss``, the optional core fields and any additional metric), e.g.
+        per-batch losses accumulated on the GPU and synced every K batches.
+        Storage is updated with one block write, and the console and sinks
+        receive a single aggregated entry for the batch: the mean of each
+        metric at the last step. Returns that aggregated entry.
+        """
+        columns = {**(metrics or {}), **columns}
+        if self.throughput is not None and columns.get('step') is not None and columns.get('epoch') is not None:
+            # Scalars are broadcast: every step of the block gets the block's average step time
+            columns.update(self.throughput.update(
+                int(np.atleast_1d(columns['step'])[-1]), int(np.atleast_1d(columns['epoch'])[-1])
+            ))
+        batch = self.metrics_storage.add_metrics_batch(columns)
+        if self.journal is not None:
+            self.journal.append_columns(batch)
+        aggregate = self._aggregate_batch(batch)
+        
+        if self._should_log(aggregate) and logger.isEnabledFor(logging.INFO):
+            logger.info("Epoch %s, Steps %s-%s (%s steps): loss=%s, accuracy=%s",
+                        aggregate.epoch, batch['step'][0], aggregate.step, len(batch['step']),
+                        "N/A" if aggregate.loss is None else f"{aggregate.loss:.4f}",
+                        "N/A" if aggregate.accuracy is None else f"{aggregate.accuracy:.4f}")
+        
+        self._emit_to_sinks(aggregate)
         
-        # Log to console/file
-        accuracy_str = f"{metrics.accuracy:.4f}" if metrics.accuracy is not None else "N/A"
-        logger.info(f"Epoch {metrics.epoch}, Step {metrics.step}: "
-                   f"loss={metrics.loss:.4f}, "
-                   f"accuracy={accuracy_str}")
+        # Step hooks due anywhere in the block fire once, with the aggregate
+        first_step = int(batch['step'][0])
+        self.dispatcher.dispatch_steps('batch_logged', first_step, aggregate.step, aggregate)
+        self.dispatcher.dispatch_steps('step_end', first_step, aggregate.step, aggregate.step, aggregate)
+        return aggregate
+    
+    @staticmethod
+    def _aggregate_batch(batch: Dict[str, np.ndarray]) -> TrainingMetrics:
+        """Reduce a normalized batch to one TrainingMetrics holding per-metric means"""
+        def mean(values):
+            valid = values[~np.isnan(values)]
+            return float(valid.mean()) if len(valid) else None
         
-        # Log to TensorBoard
+        core = set(MetricsStorage.CORE_COLUMNS)
+        return TrainingMetrics(
+            epoch=int(batch['epoch'][-1]),
+            step=int(batch['step'][-1]),
+            loss=mean(batch['loss']),
+            accuracy=mean(batch['accuracy']),
+            val_loss=mean(batch['val_loss']),
+            val_accuracy=mean(batch['val_accuracy']),
+            learning_rate=mean(batch['learning_rate']),
+            timestamp=MetricsStorage._EPOCH + int(batch['timestamp'][-1]) * MetricsStorage._MICROSECOND,
+            additional_metrics={
+                key: value
+                for key, value in ((key, mean(batch[key])) for key in batch if key not in core)
+                if value is not None
+            }
+        )
+    
+    def _emit_to_sinks(self, metrics: TrainingMetrics):
+        """Send metrics to the sinks, through the background writer if enabled"""
+        if self.sink_writer is not None:
+            self.sink_writer.put(metrics)
+        elif self.tensorboard_writer or self.wandb_available:
+            self._write_to_sinks([metrics])
+    
+    def _write_to_sinks(self, batch: List[TrainingMetrics]):
+        """Write a batch of metrics to TensorBoard and W&B"""
         if self.tensorboard_writer:
-            self.tensorboard_writer.add_scalar('Loss/train', metrics.loss, metrics.step)
-            if metrics.accuracy:
-                self.tensorboard_writer.add_scalar('Accuracy/train', metrics.accuracy, metrics.step)
-            if metrics.val_loss:
-                self.tensorboard_writer.add_scalar('Loss/val', metrics.val_loss, metrics.step)
-            if metrics.val_accuracy:
-                self.tensorboard_writer.add_scalar('Accuracy/val', metrics.val_accuracy, metrics.step)
-            if metrics.learning_rate:
-                self.tensorboard_writer.add_scalar('Learning_Rate', metrics.learning_rate, metrics.step)
-        
-        # Log to W&B
+            for metrics in batch:
+                self.tensorboard_writer.add_scalar('Loss/train', metrics.loss, metrics.step)
+                if metrics.accuracy:
+                    self.tensorboard_writer.add_scalar('Accuracy/train', metrics.accuracy, metrics.step)
+                if metrics.val_loss:
+                    self.tensorboard_writer.add_scalar('Loss/val', metrics.val_loss, metrics.step)
+                if metrics.val_accuracy:
+                    self.tensorboard_writer.add_scalar('Accuracy/val', metrics.val_accuracy, metrics.step)
+                if metrics.learning_rate:
+                    self.tensorboard_writer.add_scalar('Learning_Rate', metrics.learning_rate, metrics.step)
+                for name in THROUGHPUT_METRICS:
+                    if name in metrics.additional_metrics:
+                        self.tensorboard_writer.add_scalar(f'Throughput/{name}', metrics.additional_metrics[name], metrics.step)
+        
         if self.wandb_available:
             import wandb
-            log_dict = {
-                'train/loss': metrics.loss,
-                'epoch': metrics.epoch,
-                'step': metrics.step
-            }
-            if metrics.accuracy:
-                log_dict['train/accuracy'] = metrics.accuracy
-            if metrics.val_loss:
-                log_dict['val/loss'] = metrics.val_loss
-            if metrics.val_accuracy:
-                log_dict['val/accuracy'] = metrics.val_accuracy
-            if metrics.learning_rate:
-                log_dict['learning_rate'] = metrics.learning_rate
-            log_dict.update({f'metrics/{k}': v for k, v in metrics.additional_metrics.items()})
-            wandb.log(log_dict)
+            for metrics in batch:
+                log_dict = {
+                    'train/loss': metrics.loss,
+                    'epoch': metrics.epoch,
+                    'step': metrics.step
+                }
+                if metrics.accuracy:
+                    log_dict['train/accuracy'] = metrics.accuracy
+                if metrics.val_loss:
+                    log_dict['val/loss'] = metrics.val_loss
+                if metrics.val_accuracy:
+                    log_dict['val/accuracy'] = metrics.val_accuracy
+                if metrics.learning_rate:
+                    log_dict['learning_rate'] = metrics.learning_rate
+                log_dict.update({f'metrics/{k}': v for k, v in metrics.additional_metrics.items()})
+                wandb.log(log_dict)
+    
+    def phase(self, name: str):
+        """Time a named phase of the training step
+        
+        Use as ``with tracker.phase('forward'):`` or as a decorator. Each
+        epoch's breakdown is logged at ``on_epoch_end``, stored with the
+        epoch's metrics as ``phase_<name>_seconds`` and kept in
+        ``summary['phases']``.
+        """
+        return self.profiler.phase(name)
+    
+    def profile_iter(self, iterable, name: str = 'data'):
+        """Iterate ``iterable`` (e.g. a DataLoader), timing each fetch as phase ``name``"""
+        return self.profiler.iterate(name, iterable)
     
     def on_epoch_end(self, epoch: int, metrics: TrainingMetrics):
         """Called at the end of each epoch"""
+        breakdown = self.profiler.end_epoch(epoch)
+        if breakdown:
+            logger.info("Epoch %s phases: %s", epoch, ", ".join(
+                f"{name} {stats['total_seconds']:.3f}s ({stats['fraction']:.0%})"
+                for name, stats in breakdown.items()
+            ))
+            metrics = replace(metrics, additional_metrics={
+                **metrics.additional_metrics,
+                **{f'phase_{name}_seconds': stats['total_seconds'] for name, stats in breakdown.items()}
+            })
         self.log_metrics(metrics)
-        
-        # Call callbacks
-        for callback in self.callbacks:
-            callback.on_epoch_end(epoch, metrics)
+        self.dispatcher.dispatch('epoch_end', epoch, metrics)
+    
+    def on_validation_end(self, epoch: int, metrics: TrainingMetrics):
+        """Log validation metrics and notify validation callbacks"""
+        self.log_metrics(metrics)
+        self.dispatcher.dispatch('validation_end', epoch, metrics)
     
     def end_training(self):
         """Mark the end of training"""
         self.training_end_time = datetime.now()
         
+        # Reduce whatever the worker ranks still have in flight
+        if self.aggregator is not None:
+            self.aggregator.close()
+        
         if self.training_start_time:
             duration = self.training_end_time - self.training_start_time
             logger.info(f"Training completed in {duration}")
@@ -382,11 +3731,24 @@ class TrainingTracker:
         recent_metrics = self.metrics_storage.get_recent_metrics(1)
         final_metrics = recent_metrics[0] if recent_metrics else None
         
-        # Call callbacks
-        for callback in self.callbacks:
-            callback.on_training_end(final_metrics)
+        self.dispatcher.dispatch('training_end', final_metrics)
+        
+        if self.journal is not None:
+            self.journal.close()
+        
+        if self.resource_sampler is not None:
+            self.resource_sampler.stop()
+        
+        # Stop publishing to the shared memory ring
+        self.metrics_storage.close()
+        
+        # Let pending background reports finish
+        self._shutdown_reports()
+        
+        # Drain queued sink writes before closing external integrations
+        if self.sink_writer is not None:
+            self.sink_writer.close()
         
-        # Close external integrations
         if self.tensorboard_writer:
             self.tensorboard_writer.close()
         
@@ -394,51 +3756,127 @@ class TrainingTracker:
             import wandb
             wandb.finish()
         
+        if self.self_profile is not None:
+            overhead = self.self_profile.report()
+            logger.info(f"Tracker self-overhead: {overhead['tracker_seconds']:.3f}s "
+                        f"({overhead['percent_of_wall']:.2f}% of {overhead['wall_seconds']:.1f}s wall time)")
+        
         logger.info("Training ended")
+        self._finish_async_file_logging()
     
     def get_training_summary(self) -> Dict[str, Any]:
         """Get a summary of the training process"""
-        metrics_df = self.metrics_storage.get_metrics_df()
-        best_metrics = self.metrics_storage.best_metrics
+        storage = self.metrics_storage
+        max_epoch = storage.max_epoch
         
         summary = {
             'experiment_name': self.config.experiment_name,
             'model_name': self.config.model_name,
             'framework': self.config.framework,
-            'total_epochs': metrics_df['epoch'].max() if not metrics_df.empty else 0,
-            'total_steps': len(metrics_df),
-            'best_metrics': best_metrics,
+            'total_epochs': max_epoch if max_epoch is not None else 0,
+            'total_steps': storage.total_steps,
+            'best_metrics': storage.best_metrics,
+            'metric_statistics': storage.get_statistics(),
             'training_duration': None
         }
         
         if self.training_start_time and self.training_end_time:
             duration = self.training_end_time - self.training_start_time
             summary['training_duration'] = str(duration)
+            summary['training_duration_seconds'] = duration.total_seconds()
+        
+        if self.throughput is not None:
+            summary['throughput'] = self.throughput.summary()
+        
+        phases = self.profiler.summary()
+        if phases['total']:
+            summary['phases'] = phases
         
+        if self.self_profile is not None:
+            summary['self_profile'] = self.self_profile.report()
+        
+        if self.resource_sampler is not None:
+            summary['resources'] = self._resource_summary()
+        
+        return summary
+    
+    def _resource_summary(self) -> Dict[str, Dict[str, float]]:
+        """Last, mean and max of each sampled resource metric"""
+        summary = {}
+        for name, values in self.metrics_storage.get_time_series('resources').items():
+            if name == 'timestamp':
+                continue
+            valid = values[~np.isnan(values)]
+            if len(valid):
+                summary[name] = {'last': float(valid[-1]), 'mean': float(valid.mean()), 'max': float(valid.max())}
         return summary
     
-    def save_training_report(self, filepath: Optional[str] = None):
-        """Save a comprehensive training report"""
+    def save_training_report(self, filepath: Optional[str] = None, format: Optional[str] = None):
+        """Save a comprehensive training report
+        
+        ``format`` defaults to ``config.report_format``. With ``'json'`` the
+        metrics are embedded in the report as records. The columnar formats
+        (``'parquet'``, ``'arrow-ipc'``, ``'npz'``) write the metrics as a
+        typed, compressed table next to a small JSON sidecar holding the
+        summary and config; the sidecar path is returned. When ``filepath``
+        already has the table's extension (``run.parquet``), the table is
+        written there and the sidecar to ``run.json``.
+        
+        With ``config.async_reports`` the metrics are snapshotted and the
+        report is written on a background thread; a Future resolving to the
+        report path is returned immediately.
+        """
+        format = format or self.config.report_format
+        if format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format {format!r}, expected one of {tuple(REPORT_FORMATS)}")
         if filepath is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = self.log_dir / f"{self.config.experiment_name}_report_{timestamp}.json"
+        elif format != 'json' and Path(filepath).suffix == REPORT_FORMATS[format]:
+            # The path names the table; the sidecar must not overwrite it
+            filepath = os.path.splitext(filepath)[0] + '.json'
         
         summary = self.get_training_summary()
-        metrics_df = self.metrics_storage.get_metrics_df()
+        arrays = self.metrics_storage.get_metrics_arrays()
         
-        # Generate plots
+        if not self.config.async_reports:
+            return self._write_training_report(filepath, format, summary, arrays)
+        
+        # Copy the columns so later writes to the ring cannot change the report
+        arrays = {name: np.array(values) for name, values in arrays.items()}
+        if self._report_executor is None:
+            self._report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='report')
+        return self._report_executor.submit(self._write_training_report, filepath, format, summary, arrays)
+    
+    def _write_training_report(self, filepath, format: str, summary: Dict[str, Any],
+                               arrays: Dict[str, np.ndarray]):
+        """Render plots and write a report from a metrics snapshot"""
         plots_dir = self.log_dir / 'plots'
         plots_dir.mkdir(exist_ok=True)
         
-        self._generate_plots(plots_dir)
+        # Figures render in the worker processes while the metrics are written
+        plot_futures = self._submit_plots(plots_dir, arrays)
         
         report = {
             'summary': summary,
-            'metrics_data': metrics_df.to_dict('records') if not metrics_df.empty else [],
             'config': asdict(self.config),
             'plots_directory': str(plots_dir)
         }
         
+        if format == 'json':
+            import pandas as pd
+            report['metrics_data'] = pd.DataFrame(arrays).to_dict('records') if arrays else []
+        else:
+            metrics_path = Path(filepath).with_suffix(REPORT_FORMATS[format])
+            write_metrics_table(arrays, metrics_path, format)
+            report['metrics_file'] = metrics_path.name
+            report['metrics_format'] = format
+        
+        for future in plot_futures:
+            future.result()
+        if plot_futures:
+            logger.info(f"Training plots saved to {plots_dir}")
+        
         with open(filepath, 'w') as f:
             json.dump(report, f, indent=2, default=str)
         
@@ -446,78 +3884,54 @@ class TrainingTracker:
         return filepath
     
     def _generate_plots(self, plots_dir: Path):
-        """Generate training plots"""
-        metrics_df = self.metrics_storage.get_metrics_df()
-        if metrics_df.empty:
-            return
+        """Generate training plots
         
-        # Set style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
+        Each line series is decimated to ``config.plot_max_points`` so the
+        render time stays bounded regardless of run length.
+        """
+        futures = self._submit_plots(plots_dir, self.metrics_storage.get_metrics_arrays())
+        for future in futures:
+            future.result()
+        if futures:
+            logger.info(f"Training plots saved to {plots_dir}")
+    
+    def _submit_plots(self, plots_dir: Path, arrays: Dict[str, np.ndarray]) -> List[Future]:
+        """Start rendering each report figure, in parallel when workers are enabled"""
+        if not arrays:
+            return []
         
-        # Loss plot
-        plt.figure(figsize=(12, 8))
-        plt.subplot(2, 2, 1)
-        plt.plot(metrics_df['step'], metrics_df['loss'], label='Training Loss', alpha=0.8)
-        if 'val_loss' in metrics_df.columns and not metrics_df['val_loss'].isna().all():
-            plt.plot(metrics_df['step'], metrics_df['val_loss'], label='Validation Loss', alpha=0.8)
-        plt.xlabel('Step')
-        plt.ylabel('Loss')
-        plt.title('Training and Validation Loss')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        columns = {name: arrays[name] for name in PLOT_COLUMNS if name in arrays}
+        settings = {
+            'max_points': self.config.plot_max_points,
+            'method': self.config.plot_downsample,
+            'ema_alpha': self.config.plot_ema_alpha,
+        }
+        jobs = [(_render_training_plots, plots_dir / 'training_plots.png')]
+        valid = ~(np.isnan(columns['accuracy']) | np.isnan(columns['val_accuracy']))
+        if valid.any():
+            jobs.append((_render_accuracy_correlation, plots_dir / 'accuracy_correlation.png'))
         
-        # Accuracy plot
-        plt.subplot(2, 2, 2)
-        if 'accuracy' in metrics_df.columns and not metrics_df['accuracy'].isna().all():
-            plt.plot(metrics_df['step'], metrics_df['accuracy'], label='Training Accuracy', alpha=0.8)
-        if 'val_accuracy' in metrics_df.columns and not metrics_df['val_accuracy'].isna().all():
-            plt.plot(metrics_df['step'], metrics_df['val_accuracy'], label='Validation Accuracy', alpha=0.8)
-        plt.xlabel('Step')
-        plt.ylabel('Accuracy')
-        plt.title('Training and Validation Accuracy')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        if self.config.plot_workers > 0:
+            pool = _get_plot_pool(self.config.plot_workers)
+            return [pool.submit(render, columns, path, **settings) for render, path in jobs]
         
-        # Learning rate plot
-        plt.subplot(2, 2, 3)
-        if 'learning_rate' in metrics_df.columns and not metrics_df['learning_rate'].isna().all():
-            plt.plot(metrics_df['step'], metrics_df['learning_rate'], label='Learning Rate', alpha=0.8)
-            plt.xlabel('Step')
-            plt.ylabel('Learning Rate')
-            plt.title('Learning Rate Schedule')
-            plt.legend()
-            plt.grid(True, alpha=0.3)
-        
-        # Loss distribution
-        plt.subplot(2, 2, 4)
-        plt.hist(metrics_df['loss'], bins=30, alpha=0.7, edgecolor='black')
-        plt.xlabel('Loss')
-        plt.ylabel('Frequency')
-        plt.title('Loss Distribution')
-        plt.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(plots_dir / 'training_plots.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # Training vs validation correlation
-        if ('accuracy' in metrics_df.columns and 'val_accuracy' in metrics_df.columns and 
-            not metrics_df[['accuracy', 'val_accuracy']].isna().any(axis=1).all()):
-            
-            plt.figure(figsize=(10, 6))
-            valid_data = metrics_df[['accuracy', 'val_accuracy']].dropna()
-            plt.scatter(valid_data['accuracy'], valid_data['val_accuracy'], alpha=0.6)
-            plt.xlabel('Training Accuracy')
-            plt.ylabel('Validation Accuracy')
-            plt.title('Training vs Validation Accuracy Correlation')
-            plt.plot([0, 1], [0, 1], 'r--', alpha=0.5, label='Perfect Correlation')
-            plt.legend()
-            plt.grid(True, alpha=0.3)
-            plt.savefig(plots_dir / 'accuracy_correlation.png', dpi=300, bbox_inches='tight')
-            plt.close()
-        
-        logger.info(f"Training plots saved to {plots_dir}")
+        futures = []
+        for render, path in jobs:
+            future = Future()
+            future.set_result(render(columns, path, **settings))
+            futures.append(future)
+        return futures
+    
+    def wait_for_reports(self):
+        """Block until every pending background report has been written"""
+        if self._report_executor is not None:
+            self._report_executor.submit(lambda: None).result()
+    
+    def _shutdown_reports(self):
+        """Finish pending reports and stop the report thread"""
+        if self._report_executor is not None:
+            self._report_executor.shutdown(wait=True)
+            self._report_executor = None
 
 # PyTorch-specific integration
 if TORCH_AVAILABLE:
@@ -528,7 +3942,7 @@ if TORCH_AVAILABLE:
             self.tracker = tracker
             self.step_count = 0
         
-        def create_tracker_hook(self, model: torch.nn.Module, optimizer: torch.optim.Optimizer):
+        def create_tracker_hook(self, model: 'torch.nn.Module', optimizer: 'torch.optim.Optimizer'):
             """Create a hook for PyTorch training loop"""
             def hook(module, input, output):
                 self.step_count += 1
@@ -562,6 +3976,8 @@ if TENSORFLOW_AVAILABLE:
         
         def create_keras_callback(self):
             """Create a Keras callback for training tracking"""
+            import tensorflow as tf
+            
             class TrackingCallback(tf.keras.callbacks.Callback):
                 def __init__(self, tracker: TrainingTracker):
                     super().__init__()
@@ -605,59 +4021,636 @@ def create_training_tracker(
     )
     return TrainingTracker(config)
 
+REPORT_FORMATS = {
+    'json': '.json',
+    'parquet': '.parquet',
+    'arrow-ipc': '.arrow',
+    'npz': '.npz',
+}
+
+def write_metrics_table(arrays: Dict[str, np.ndarray], path: Union[str, Path], format: str = 'parquet'):
+    """Write metric columns as a typed, compressed columnar file
+    
+    Supports ``'parquet'`` and ``'arrow-ipc'`` (both require pyarrow) and
+    ``'npz'``. Timestamps keep their datetime64 type.
+    """
+    if format == 'npz':
+        # Same layout as np.savez_compressed, but with a fast deflate level
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            for name, values in arrays.items():
+                with archive.open(f'{name}.npy', 'w', force_zip64=True) as f:
+                    np.lib.format.write_array(f, np.asarray(values), allow_pickle=False)
+        return
+    if format not in ('parquet', 'arrow-ipc'):
+        raise ValueError(f"Unsupported columnar format {format!r}")
+    
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(f"pyarrow not available. Please install pyarrow to write {format} reports.")
+    table = pa.table({name: np.asarray(values) for name, values in arrays.items()})
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, path, compression='zstd')
+    else:
+        import pyarrow.ipc
+        options = pa.ipc.IpcWriteOptions(compression='zstd')
+        with pa.ipc.new_file(str(path), table.schema, options=options) as writer:
+            writer.write_table(table)
+
+def read_metrics_table(path: Union[str, Path]) -> 'pd.DataFrame':
+    """Read a metrics file written by write_metrics_table"""
+    import pandas as pd
+    path = Path(path)
+    if path.suffix == '.npz':
+        with np.load(path) as data:
+            return pd.DataFrame({name: data[name] for name in data.files})
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path)
+    if path.suffix == '.arrow':
+        return pd.read_feather(path)
+    raise ValueError(f"Unknown metrics file type: {path}")
+
+DOWNSAMPLE_METHODS = ('minmax', 'lttb', 'none')
+
+def downsample_minmax(x: np.ndarray, y: np.ndarray, max_points: int):
+    """Decimate a series to at most max_points, keeping each bucket's extremes
+    
+    The series is split into ``max_points // 2`` equal buckets and the minimum
+    and maximum of every bucket are kept in their original order, so spikes
+    survive decimation. Returns the selected ``(x, y)``.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    buckets = max_points // 2
+    if n <= max_points or buckets < 1:
+        return x, y
+    
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    padded = np.empty(buckets * size)
+    padded[:n] = y
+    padded[n:] = np.inf
+    lows = padded.reshape(buckets, size).argmin(axis=1)
+    padded[n:] = -np.inf
+    highs = padded.reshape(buckets, size).argmax(axis=1)
+    
+    offsets = np.arange(buckets) * size
+    index = np.sort(np.stack([lows, highs], axis=1), axis=1) + offsets[:, None]
+    index = index.ravel()
+    # Drop the duplicate when a bucket's min and max are the same point
+    keep = np.ones(len(index), dtype=bool)
+    keep[1:] = index[1:] != index[:-1]
+    index = index[keep]
+    return x[index], y[index]
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, max_points: int):
+    """Decimate a series with Largest-Triangle-Three-Buckets
+    
+    Keeps the first and last points and, from each of ``max_points - 2``
+    buckets, the point forming the largest triangle with the previously
+    selected point and the next bucket's mean. Returns the selected ``(x, y)``.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return x, y
+    
+    xf = x.astype(np.float64)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    index = np.empty(max_points, dtype=np.int64)
+    index[0] = 0
+    index[-1] = n - 1
+    selected = 0
+    for i in range(max_points - 2):
+        start, stop = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_stop = edges[i + 1], edges[i + 2]
+            mean_x = xf[next_start:next_stop].mean()
+            mean_y = y[next_start:next_stop].mean()
+        else:
+            mean_x, mean_y = xf[-1], y[-1]
+        
+        area = np.abs(
+            (xf[selected] - mean_x) * (y[start:stop] - y[selected])
+            - (xf[selected] - xf[start:stop]) * (mean_y - y[selected])
+        )
+        selected = start + int(area.argmax())
+        index[i + 1] = selected
+    return x[index], y[index]
+
+def downsample_series(x: np.ndarray, y: np.ndarray, max_points: int, method: str = 'minmax'):
+    """Drop NaNs from a series and decimate it with the given method"""
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsample method {method!r}, expected one of {DOWNSAMPLE_METHODS}")
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x, y = x[valid], y[valid]
+    if method == 'minmax':
+        return downsample_minmax(x, y, max_points)
+    if method == 'lttb':
+        return downsample_lttb(x, y, max_points)
+    return x, y
+
+def exponential_moving_average(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponential moving average of a series, ignoring NaNs"""
+    if not 0 < alpha <= 1:
+        raise ValueError(f"EMA alpha must be in (0, 1], got {alpha}")
+    import pandas as pd
+    return pd.Series(values).ewm(alpha=alpha, ignore_na=True).mean().to_numpy()
+
+def _plot_series(x, y, label: str, max_points: int = 2000, method: str = 'minmax',
+                 ema_alpha: Optional[float] = None, ax=None):
+    """Plot a decimated series, with an optional EMA overlay"""
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+    px, py = downsample_series(x, y, max_points, method)
+    if ema_alpha is None:
+        return ax.plot(px, py, label=label, alpha=0.8)
+    
+    lines = ax.plot(px, py, label=label, alpha=0.3)
+    ex, ey = downsample_series(x, exponential_moving_average(y, ema_alpha), max_points, method)
+    ax.plot(ex, ey, label=f"{label} (EMA)", color=lines[0].get_color(), alpha=0.9)
+    return lines
+
+PLOT_COLUMNS = ('step', 'loss', 'val_loss', 'accuracy', 'val_accuracy', 'learning_rate')
+
+# rcParams are process-global, so in-process renders are serialized
+_RENDER_LOCK = threading.Lock()
+
+class _PlotWorkerPool:
+    """Long-lived render subprocesses fed pickled jobs over pipes
+    
+    Workers are plain ``python -c`` subprocesses rather than multiprocessing
+    children, so they never re-import the training script's ``__main__`` and
+    inherit no framework or CUDA state from the trainer. Each job runs on one
+    of ``max_workers`` threads, which checks out an idle worker for it.
+    """
+    
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='plot')
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+        self._processes: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+    
+    def submit(self, render: Callable, arrays: Dict[str, np.ndarray], path: Path, **settings) -> Future:
+        """Render a figure in a worker process"""
+        return self._executor.submit(self._run, render, arrays, path, settings)
+    
+    def _start_worker(self) -> subprocess.Popen:
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        module = Path(__file__).stem
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [module_dir, env.get('PYTHONPATH')]))
+        env['MPLBACKEND'] = 'Agg'
+        process = subprocess.Popen(
+            [sys.executable, '-c', f'from {module} import _plot_worker_main; _plot_worker_main()'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env
+        )
+        with self._lock:
+            self._processes.append(process)
+        return process
+    
+    def _run(self, render: Callable, arrays: Dict[str, np.ndarray], path: Path, settings: Dict[str, Any]):
+        try:
+            process = self._idle.get_nowait()
+        except queue.Empty:
+            process = self._start_worker()
+        
+        try:
+            pickle.dump((render.__name__, arrays, path, settings), process.stdin,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+            process.stdin.flush()
+            ok, result = pickle.load(process.stdout)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            process.kill()
+            logger.warning(f"Plot worker exited unexpectedly (code {process.wait()}), rendering in process")
+            return render(arrays, path, **settings)
+        
+        self._idle.put(process)
+        if not ok:
+            raise result
+        return result
+    
+    def shutdown(self):
+        """Wait for pending renders and stop the workers"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            processes, self._processes = self._processes, []
+        for process in processes:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+def _plot_worker_main():
+    """Entry point of a plot worker process: render jobs read from stdin"""
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    # Anything printed while rendering must not corrupt the result stream
+    sys.stdout = sys.stderr
+    renderers = {render.__name__: render for render in (_render_training_plots, _render_accuracy_correlation)}
+    while True:
+        try:
+            name, arrays, path, settings = pickle.load(stdin)
+        except EOFError:
+            return
+        try:
+            reply = (True, renderers[name](arrays, path, **settings))
+        except Exception as e:
+            reply = (False, RuntimeError(f"{name} failed: {e!r}"))
+        pickle.dump(reply, stdout, protocol=pickle.HIGHEST_PROTOCOL)
+        stdout.flush()
+
+# Plot worker pools shared by all trackers, keyed by worker count
+_PLOT_POOLS: Dict[int, _PlotWorkerPool] = {}
+_PLOT_POOLS_LOCK = threading.Lock()
+
+def _get_plot_pool(max_workers: int) -> _PlotWorkerPool:
+    """Get the shared plot worker pool; workers stay alive between reports"""
+    with _PLOT_POOLS_LOCK:
+        pool = _PLOT_POOLS.get(max_workers)
+        if pool is None:
+            pool = _PLOT_POOLS[max_workers] = _PlotWorkerPool(max_workers)
+        return pool
+
+@atexit.register
+def _shutdown_plot_pools():
+    with _PLOT_POOLS_LOCK:
+        pools = list(_PLOT_POOLS.values())
+        _PLOT_POOLS.clear()
+    for pool in pools:
+        pool.shutdown()
+
+def _plot_style():
+    """Style context shared by the report figures"""
+    import matplotlib
+    import matplotlib.style
+    import seaborn as sns
+    return matplotlib.rc_context({
+        **matplotlib.style.library['seaborn-v0_8'],
+        'axes.prop_cycle': matplotlib.cycler(color=sns.color_palette("husl")),
+    })
+
+def _has_values(arrays: Dict[str, np.ndarray], name: str) -> bool:
+    return name in arrays and not np.isnan(arrays[name]).all()
+
+def _render_training_plots(arrays: Dict[str, np.ndarray], path: Path, max_points: int = 2000,
+                           method: str = 'minmax', ema_alpha: Optional[float] = None):
+    """Render the loss, accuracy, learning rate and loss distribution figure
+    
+    Uses the object-oriented Agg API without pyplot, so it is safe to run in
+    worker processes and threads.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    def plot_series(ax, name, label):
+        _plot_series(arrays['step'], arrays[name], label, max_points=max_points,
+                     method=method, ema_alpha=ema_alpha, ax=ax)
+    
+    with _RENDER_LOCK, _plot_style():
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        (loss_ax, accuracy_ax), (lr_ax, hist_ax) = fig.subplots(2, 2, squeeze=False)
+        
+        # Loss plot
+        plot_series(loss_ax, 'loss', 'Training Loss')
+        if _has_values(arrays, 'val_loss'):
+            plot_series(loss_ax, 'val_loss', 'Validation Loss')
+        loss_ax.set_xlabel('Step')
+        loss_ax.set_ylabel('Loss')
+        loss_ax.set_title('Training and Validation Loss')
+        loss_ax.legend()
+        loss_ax.grid(True, alpha=0.3)
+        
+        # Accuracy plot
+        if _has_values(arrays, 'accuracy'):
+            plot_series(accuracy_ax, 'accuracy', 'Training Accuracy')
+        if _has_values(arrays, 'val_accuracy'):
+            plot_series(accuracy_ax, 'val_accuracy', 'Validation Accuracy')
+        accuracy_ax.set_xlabel('Step')
+        accuracy_ax.set_ylabel('Accuracy')
+        accuracy_ax.set_title('Training and Validation Accuracy')
+        accuracy_ax.legend()
+        accuracy_ax.grid(True, alpha=0.3)
+        
+        # Learning rate plot
+        if _has_values(arrays, 'learning_rate'):
+            plot_series(lr_ax, 'learning_rate', 'Learning Rate')
+            lr_ax.set_xlabel('Step')
+            lr_ax.set_ylabel('Learning Rate')
+            lr_ax.set_title('Learning Rate Schedule')
+            lr_ax.legend()
+            lr_ax.grid(True, alpha=0.3)
+        
+        # Loss distribution (binned by NumPy, so it is cheap at any length)
+        loss = arrays['loss']
+        hist_ax.hist(loss[~np.isnan(loss)], bins=30, alpha=0.7, edgecolor='black')
+        hist_ax.set_xlabel('Loss')
+        hist_ax.set_ylabel('Frequency')
+        hist_ax.set_title('Loss Distribution')
+        hist_ax.grid(True, alpha=0.3)
+        
+        fig.tight_layout()
+        fig.savefig(path, dpi=300, bbox_inches='tight')
+    return path
+
+def _render_accuracy_correlation(arrays: Dict[str, np.ndarray], path: Path, max_points: int = 2000,
+                                 method: str = 'minmax', ema_alpha: Optional[float] = None):
+    """Render the training vs validation accuracy scatter"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    valid = ~(np.isnan(arrays['accuracy']) | np.isnan(arrays['val_accuracy']))
+    accuracy = arrays['accuracy'][valid]
+    val_accuracy = arrays['val_accuracy'][valid]
+    # A uniform stride keeps the scatter's density representative
+    stride = max(1, -(-len(accuracy) // max(max_points, 1)))
+    
+    with _RENDER_LOCK, _plot_style():
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.scatter(accuracy[::stride], val_accuracy[::stride], alpha=0.6)
+        ax.set_xlabel('Training Accuracy')
+        ax.set_ylabel('Validation Accuracy')
+        ax.set_title('Training vs Validation Accuracy Correlation')
+        ax.plot([0, 1], [0, 1], 'r--', alpha=0.5, label='Perfect Correlation')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        fig.savefig(path, dpi=300, bbox_inches='tight')
+    return path
+
+COMPARISON_AXES = ('step', 'epoch', 'wall_time')
+
+def _comparison_mode(metric: str) -> str:
+    """Default optimization direction: 'max' for accuracy-like metrics and rates"""
+    return 'max' if 'acc' in metric or metric.endswith('_per_sec') else 'min'
+
+def _load_run(run, columns: List[str]):
+    """Name and metric columns of a tracker, RunReader or journal directory"""
+    if isinstance(run, TrainingTracker):
+        return run.config.experiment_name, run.metrics_storage.get_metrics_arrays(columns)
+    if not isinstance(run, RunReader):
+        run = RunReader(run)
+    name = run.directory.name
+    if name.endswith('_metrics'):
+        name = name[:-len('_metrics')]
+    available = set(run.columns)
+    return name, run.select([column for column in columns if column in available])
+
+def _epoch_means(epochs: np.ndarray, values: Dict[str, np.ndarray], seconds: np.ndarray):
+    """Reduce row series to one NaN-ignoring mean per epoch"""
+    order = np.argsort(epochs, kind='stable')
+    unique, starts = np.unique(epochs[order], return_index=True)
+    ends = np.append(starts[1:], len(order)) - 1
+    means = {}
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for name, y in values.items():
+            y = y[order]
+            valid = ~np.isnan(y)
+            sums = np.add.reduceat(np.where(valid, y, 0.0), starts)
+            means[name] = sums / np.add.reduceat(valid.astype(np.int64), starts)
+    return unique.astype(np.float64), means, seconds[order][ends]
+
+class RunComparison:
+    """Several runs aligned on a common axis, with per-run aggregates
+    
+    Built by compare_runs. ``curves[metric]`` is an ``(n_runs, len(grid))``
+    array of each run interpolated onto ``grid`` (NaN outside a run's range),
+    ``summary`` is a tidy table with one row per run and metric, and
+    ``plot`` draws the downsampled curves.
+    """
+    
+    def __init__(self, axis: str, metrics: List[str], runs: List[str], grid: np.ndarray,
+                 curves: Dict[str, np.ndarray], records: List[Dict[str, Any]],
+                 durations: Dict[str, float], series: List[Dict[str, Any]]):
+        self.axis = axis
+        self.metrics = metrics
+        self.runs = runs
+        self.grid = grid
+        self.curves = curves
+        self.records = records
+        self.durations = durations
+        self._series = series
+    
+    @property
+    def summary(self) -> 'pd.DataFrame':
+        """Per-run aggregates: best, final, time-to-threshold and area under curve"""
+        import pandas as pd
+        return pd.DataFrame(self.records)
+    
+    def to_frame(self) -> 'pd.DataFrame':
+        """Aligned curves as a tidy table with run, axis, metric and value columns"""
+        import pandas as pd
+        n_runs, n_points = len(self.runs), len(self.grid)
+        frames = [
+            pd.DataFrame({
+                'run': np.repeat(np.asarray(self.runs, dtype=object), n_points),
+                self.axis: np.tile(self.grid, n_runs),
+                'metric': metric,
+                'value': self.curves[metric].ravel(),
+            })
+            for metric in self.metrics
+        ]
+        return pd.concat(frames, ignore_index=True)
+    
+    def band(self, metric: str) -> Dict[str, np.ndarray]:
+        """Mean, std, min and max across runs at each grid point, ignoring gaps"""
+        curves = self.curves[metric]
+        with np.errstate(invalid='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return {
+                'mean': np.nanmean(curves, axis=0),
+                'std': np.nanstd(curves, axis=0),
+                'min': np.nanmin(curves, axis=0),
+                'max': np.nanmax(curves, axis=0),
+            }
+    
+    def plot(self, save_path: Optional[str] = None, max_points: int = 2000,
+             method: str = 'minmax', ema_alpha: Optional[float] = None):
+        """Plot every run's downsampled curves and the run durations
+        
+        With more than two runs the cross-run mean is overlaid. Returns the
+        matplotlib Figure, saving it to ``save_path`` when given.
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        panels = len(self.metrics) + 1
+        ncols = min(3, panels)
+        nrows = -(-panels // ncols)
+        label = self.axis.replace('_', ' ').title() + (' (s)' if self.axis == 'wall_time' else '')
+        
+        with _RENDER_LOCK, _plot_style():
+            fig = Figure(figsize=(5 * ncols, 5 * nrows))
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(nrows, ncols, squeeze=False).ravel()
+            
+            for ax, metric in zip(axes, self.metrics):
+                for series in self._series:
+                    _plot_series(series['x'], series['values'][metric], series['name'],
+                                 max_points=max_points, method=method, ema_alpha=ema_alpha, ax=ax)
+                if len(self.runs) > 2:
+                    ax.plot(self.grid, self.band(metric)['mean'], 'k--', label='Mean', alpha=0.9)
+                ax.set_xlabel(label)
+                ax.set_ylabel(metric.replace('_', ' ').title())
+                ax.set_title(f"{metric.replace('_', ' ').title()} Comparison")
+                if len(self.runs) <= 10:
+                    ax.legend()
+                ax.grid(True, alpha=0.3)
+            
+            duration_ax = axes[len(self.metrics)]
+            duration_ax.bar(self.runs, [self.durations[name] for name in self.runs])
+            duration_ax.set_ylabel('Seconds')
+            duration_ax.set_title('Training Duration Comparison')
+            duration_ax.tick_params(axis='x', labelrotation=45)
+            for ax in axes[panels:]:
+                ax.set_visible(False)
+            
+            fig.tight_layout()
+            if save_path:
+                fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        return fig
+
+def compare_runs(
+    runs: List[Any],
+    metrics: List[str] = ('loss', 'accuracy'),
+    align: str = 'step',
+    grid_points: int = 500,
+    thresholds: Optional[Dict[str, float]] = None,
+    modes: Optional[Dict[str, str]] = None
+) -> RunComparison:
+    """Align any number of runs and compute per-run aggregates
+    
+    ``runs`` may mix live TrainingTrackers, RunReaders and journal
+    directories. Runs are aligned on ``'step'``, ``'epoch'`` (one mean value
+    per epoch) or ``'wall_time'`` (seconds since the run's first metric) and
+    linearly interpolated onto a shared grid of ``grid_points``.
+    
+    ``modes`` maps metrics to ``'min'``/``'max'`` (accuracy-like names
+    default to ``'max'``). ``thresholds`` maps metrics to the value whose
+    first crossing is reported as time-to-threshold, both on the alignment
+    axis and in seconds.
+    """
+    if align not in COMPARISON_AXES:
+        raise ValueError(f"Unknown alignment {align!r}, expected one of {COMPARISON_AXES}")
+    if not runs:
+        raise ValueError("compare_runs needs at least one run")
+    metrics = list(metrics)
+    thresholds = thresholds or {}
+    modes = {metric: (modes or {}).get(metric) or _comparison_mode(metric) for metric in metrics}
+    
+    names, series, records, durations = [], [], [], {}
+    for run in runs:
+        name, arrays = _load_run(run, ['step', 'epoch', 'timestamp'] + metrics)
+        # Keep names unique so sweeps with repeated experiment names stay distinguishable
+        base, suffix = name, 2
+        while name in durations:
+            name, suffix = f"{base}#{suffix}", suffix + 1
+        
+        n = len(arrays.get('step', ()))
+        micros = arrays['timestamp'].view(np.int64) if n else np.zeros(0, dtype=np.int64)
+        seconds = (micros - micros[0]) / 1e6 if n else np.zeros(0)
+        values = {
+            metric: np.asarray(arrays[metric], dtype=np.float64) if metric in arrays else np.full(n, np.nan)
+            for metric in metrics
+        }
+        if align == 'epoch':
+            x, values, seconds = _epoch_means(arrays['epoch'], values, seconds) if n else (np.zeros(0), values, seconds)
+        else:
+            x = (seconds if align == 'wall_time' else arrays['step']).astype(np.float64)
+            if n and np.any(np.diff(x) < 0):
+                order = np.argsort(x, kind='stable')
+                x, seconds = x[order], seconds[order]
+                values = {metric: y[order] for metric, y in values.items()}
+        
+        names.append(name)
+        durations[name] = float(seconds.max()) if len(seconds) else 0.0
+        series.append({'name': name, 'x': x, 'seconds': seconds, 'values': values})
+        
+        for metric in metrics:
+            y = values[metric]
+            valid = ~np.isnan(y)
+            xs, ys, ts = x[valid], y[valid], seconds[valid]
+            record = {
+                'run': name, 'metric': metric, 'mode': modes[metric], 'count': len(ys),
+                'best': np.nan, f'best_{align}': np.nan, 'final': np.nan,
+                f'{align}_to_threshold': np.nan, 'seconds_to_threshold': np.nan,
+                'auc': np.nan, 'duration_seconds': durations[name],
+            }
+            if len(ys):
+                best = int(ys.argmax() if modes[metric] == 'max' else ys.argmin())
+                record.update({
+                    'best': ys[best], f'best_{align}': xs[best], 'final': ys[-1],
+                    'auc': float(np.sum((ys[1:] + ys[:-1]) * np.diff(xs)) / 2),
+                })
+                if metric in thresholds:
+                    hit = ys >= thresholds[metric] if modes[metric] == 'max' else ys <= thresholds[metric]
+                    if hit.any():
+                        first = int(hit.argmax())
+                        record[f'{align}_to_threshold'] = xs[first]
+                        record['seconds_to_threshold'] = ts[first]
+            records.append(record)
+    
+    # Shared grid over the union of run ranges
+    bounds = [(s['x'][0], s['x'][-1]) for s in series if len(s['x'])]
+    lo = min((b[0] for b in bounds), default=0.0)
+    hi = max((b[1] for b in bounds), default=0.0)
+    if align == 'epoch' and hi - lo + 1 <= grid_points:
+        grid = np.arange(lo, hi + 1)
+    else:
+        grid = np.linspace(lo, hi, grid_points)
+    
+    curves = {}
+    for metric in metrics:
+        aligned = np.full((len(series), len(grid)), np.nan)
+        for i, s in enumerate(series):
+            y = s['values'][metric]
+            valid = ~np.isnan(y)
+            if valid.any():
+                aligned[i] = np.interp(grid, s['x'][valid], y[valid], left=np.nan, right=np.nan)
+        curves[metric] = aligned
+    
+    return RunComparison(align, metrics, names, grid, curves, records, durations, series)
+
 def plot_training_comparison(
-    tracker1: TrainingTracker,
-    tracker2: TrainingTracker,
-    save_path: str = None
-):
-    """Compare training progress between two trackers"""
-    metrics1 = tracker1.metrics_storage.get_metrics_df()
-    metrics2 = tracker2.metrics_storage.get_metrics_df()
-    
-    plt.figure(figsize=(15, 10))
-    
-    # Loss comparison
-    plt.subplot(2, 3, 1)
-    plt.plot(metrics1['step'], metrics1['loss'], label=f"{tracker1.config.experiment_name}", alpha=0.8)
-    plt.plot(metrics2['step'], metrics2['loss'], label=f"{tracker2.config.experiment_name}", alpha=0.8)
-    plt.xlabel('Step')
-    plt.ylabel('Loss')
-    plt.title('Loss Comparison')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    # Accuracy comparison
-    if 'accuracy' in metrics1.columns and 'accuracy' in metrics2.columns:
-        plt.subplot(2, 3, 2)
-        plt.plot(metrics1['step'], metrics1['accuracy'], label=f"{tracker1.config.experiment_name}", alpha=0.8)
-        plt.plot(metrics2['step'], metrics2['accuracy'], label=f"{tracker2.config.experiment_name}", alpha=0.8)
-        plt.xlabel('Step')
-        plt.ylabel('Accuracy')
-        plt.title('Accuracy Comparison')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-    
-    # Training time comparison
-    plt.subplot(2, 3, 3)
-    summary1 = tracker1.get_training_summary()
-    summary2 = tracker2.get_training_summary()
-    
-    experiments = [summary1['experiment_name'], summary2['experiment_name']]
-    durations = [
-        summary1.get('training_duration', '0:00:00'),
-        summary2.get('training_duration', '0:00:00')
-    ]
-    
-    plt.bar(experiments, [str(d).count(':') for d in durations])  # Simplified visualization
-    plt.title('Training Duration Comparison')
-    plt.xticks(rotation=45)
-    
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    return plt
+    *runs,
+    save_path: str = None,
+    metrics: List[str] = ('loss', 'accuracy'),
+    align: str = 'step',
+    grid_points: int = 500,
+    max_points: int = 2000,
+    method: str = 'minmax',
+    ema_alpha: Optional[float] = None
+) -> RunComparison:
+    """Compare training progress between any number of runs
+    
+    Runs may be TrainingTrackers, RunReaders or journal directories; see
+    compare_runs. Series are decimated to ``max_points`` with ``method``
+    (see downsample_series); ``ema_alpha`` adds smoothed overlays. Returns
+    the RunComparison, whose ``summary`` holds the per-run aggregates.
+    
+    As in ``plot_training_comparison(tracker1, tracker2, save_path)``, a
+    trailing path that is not a journal directory is taken as ``save_path``.
+    """
+    if (save_path is None and len(runs) > 1 and isinstance(runs[-1], (str, os.PathLike))
+            and not (Path(runs[-1]) / 'journal.json').exists()):
+        *runs, save_path = runs
+    comparison = compare_runs(list(runs), metrics=metrics, align=align, grid_points=grid_points)
+    comparison.plot(save_path, max_points=max_points, method=method, ema_alpha=ema_alpha)
+    return comparison
 
 if __name__ == "__main__":
     # Example usage